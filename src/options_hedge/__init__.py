@@ -1,7 +1,11 @@
 """Portfolio insurance optimization using options."""
 
 from .analyzer import PortfolioAnalyzer
-from .fixed_floor_lp import solve_fixed_floor_lp
+from .fixed_floor_lp import (
+    solve_fixed_floor_lp,
+    solve_fixed_floor_lp_arr,
+    solve_fixed_floor_lp_batch,
+)
 from .market import Market
 from .option import Option
 from .portfolio import Portfolio
@@ -32,4 +36,6 @@ __all__ = [
     "solve_vix_ladder_lp",
     # Fixed Floor LP
     "solve_fixed_floor_lp",
+    "solve_fixed_floor_lp_arr",
+    "solve_fixed_floor_lp_batch",
 ]
@@ -6,7 +6,10 @@ including risk-adjusted return metrics, capture ratios, and drawdown analysis.
 
 from __future__ import annotations
 
+from typing import Dict, Tuple, cast
+
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 
@@ -20,11 +23,22 @@ class PortfolioAnalyzer:
     Parameters
     ----------
     data : pd.DataFrame
-        DataFrame with 'Date' column and value columns for each strategy
+        DataFrame with 'Date' column and value columns for each strategy.
+        Missing values carry the last value forward
     benchmark_col : str, optional
         Name of the benchmark column (default: "Unhedged")
     risk_free_rate : float, optional
         Annualized risk-free rate for Sharpe/Sortino calculations (default: 0.0)
+    dtype : numpy dtype, optional
+        Floating dtype of the internal arrays the metrics are computed from
+        (default: float64). ``np.float32`` halves memory traffic for large
+        strategy sets at ~7 significant digits; ``returns`` stays float64.
+
+    Raises
+    ------
+    ValueError
+        If a value column starts with missing values, which cannot be
+        forward-filled
 
     Attributes
     ----------
@@ -69,15 +83,44 @@ class PortfolioAnalyzer:
         data: pd.DataFrame,
         benchmark_col: str = "Unhedged",
         risk_free_rate: float = 0.0,
+        dtype: npt.DTypeLike = np.float64,
     ):
         self.data = data.copy()
         self.benchmark_col = benchmark_col
         self.rf = risk_free_rate
 
-        # Compute returns
-        self.returns = self.data.set_index("Date").pct_change().dropna()
+        # Compute returns directly on the value array (no pct_change/dropna).
+        # Gaps carry the last value forward, as pct_change does
+        values = self.data.set_index("Date").ffill()
+        values_np = values.to_numpy(dtype=float)
+        if np.isnan(values_np).any():
+            leading = values.columns[np.isnan(values_np[0])].tolist()
+            raise ValueError(f"Value columns {leading} start with missing values")
+        returns_np = values_np[1:] / values_np[:-1] - 1.0
+        self.returns = pd.DataFrame(
+            returns_np, index=values.index[1:], columns=values.columns
+        )
         self.benchmark_returns = self.returns[benchmark_col]
 
+        # NumPy arrays (in the requested dtype) shared by all metrics
+        self._col_idx = {col: i for i, col in enumerate(self.returns.columns)}
+        self._values_np: np.ndarray = values_np.astype(dtype, copy=False)
+        self._returns_np: np.ndarray = returns_np.astype(dtype, copy=False)
+        self._bench_np: np.ndarray = self._returns_np[:, self._col_idx[benchmark_col]]
+
+        # Benchmark is fixed, so its centered returns and sum of squares are
+        # shared by every beta calculation
+        self._bench_centered = self._bench_np - self._bench_np.mean()
+        self._bench_ss = float(self._bench_centered @ self._bench_centered)
+
+        # One-hot benchmark regime per day (columns: down, flat, up) and the
+        # benchmark's return sum in each regime, for capture ratios
+        market_regime = np.sign(self._bench_np)[:, None] == np.arange(-1, 2)
+        self._regime_onehot = market_regime.astype(self._returns_np.dtype)
+        self._bench_regime_sums = self._regime_onehot.T @ self._bench_np
+
+        self._summary_cache: Dict[float, pd.DataFrame] = {}
+
     def calculate_beta(self, strategy_col: str) -> float:
         """Calculate Beta (systematic risk vs benchmark).
 
@@ -103,9 +146,8 @@ class PortfolioAnalyzer:
         >>> beta = analyzer.calculate_beta('Strategy_A')
         >>> print(f"Beta: {beta:.2f}")
         """
-        cov_matrix = np.cov(self.returns[strategy_col], self.benchmark_returns)
-        beta = cov_matrix[0, 1] / cov_matrix[1, 1]
-        return float(beta)
+        returns = self._strategy_returns(strategy_col)
+        return float(_beta(returns, self._bench_centered, self._bench_ss)[0])
 
     def calculate_capture_ratios(self, strategy_col: str) -> tuple[float, float]:
         """Calculate Upside and Downside Capture ratios.
@@ -130,23 +172,10 @@ class PortfolioAnalyzer:
         >>> up, down = analyzer.calculate_capture_ratios('Strategy_A')
         >>> print(f"Up: {up:.1f}%, Down: {down:.1f}%")
         """
-        up_market = self.benchmark_returns > 0
-        down_market = self.benchmark_returns < 0
-
-        bench_up_avg = self.benchmark_returns[up_market].mean()
-        strat_up_avg = self.returns.loc[up_market, strategy_col].mean()
-
-        bench_down_avg = self.benchmark_returns[down_market].mean()
-        strat_down_avg = self.returns.loc[down_market, strategy_col].mean()
-
-        up_capture = (
-            (strat_up_avg / bench_up_avg) * 100 if bench_up_avg != 0 else np.nan
-        )
-        down_capture = (
-            (strat_down_avg / bench_down_avg) * 100 if bench_down_avg != 0 else np.nan
+        up_capture, down_capture = self._capture_ratios(
+            self._strategy_returns(strategy_col)
         )
-
-        return float(up_capture), float(down_capture)
+        return float(up_capture[0]), float(down_capture[0])
 
     def calculate_sortino(self, strategy_col: str) -> float:
         """Calculate Sortino Ratio (return vs downside deviation).
@@ -171,23 +200,8 @@ class PortfolioAnalyzer:
         >>> sortino = analyzer.calculate_sortino('Strategy_A')
         >>> print(f"Sortino: {sortino:.2f}")
         """
-        # Annualized return (CAGR)
-        total_return = (
-            self.data[strategy_col].iloc[-1] / self.data[strategy_col].iloc[0]
-        )
-        n_years = len(self.data) / 252  # Trading days per year
-        cagr = float(total_return ** (1 / n_years) - 1)
-
-        # Downside standard deviation (annualized)
-        neg_returns = self.returns.loc[self.returns[strategy_col] < 0, strategy_col]
-        downside_std = (
-            float(neg_returns.std() * np.sqrt(252)) if len(neg_returns) > 0 else 0.0
-        )
-
-        if downside_std == 0:
-            return float(np.nan)
-
-        return float((cagr - self.rf) / downside_std)
+        cagr = _cagr(self._strategy_values(strategy_col))
+        return float(_sortino(self._strategy_returns(strategy_col), cagr, self.rf)[0])
 
     def calculate_calmar(self, strategy_col: str) -> float:
         """Calculate Calmar Ratio (annualized return vs max drawdown).
@@ -212,28 +226,15 @@ class PortfolioAnalyzer:
         >>> calmar = analyzer.calculate_calmar('Strategy_A')
         >>> print(f"Calmar: {calmar:.2f}")
         """
-        # Annualized return
-        total_return = (
-            self.data[strategy_col].iloc[-1] / self.data[strategy_col].iloc[0]
-        )
-        n_years = len(self.data) / 252
-        cagr = float(total_return ** (1 / n_years) - 1)
-
-        # Maximum drawdown
-        peaks = self.data[strategy_col].cummax()
-        drawdowns = (self.data[strategy_col] - peaks) / peaks
-        max_drawdown = float(drawdowns.min())
-
-        if max_drawdown == 0:
-            return float(np.nan)
-
-        return float(cagr / abs(max_drawdown))
+        values = self._strategy_values(strategy_col)
+        return float(_calmar(values, _cagr(values))[0])
 
     def get_summary(self) -> pd.DataFrame:
         """Generate comprehensive summary table for all strategies.
 
         Creates a DataFrame with all key metrics for easy comparison
-        across strategies.
+        across strategies. The table is cached per risk-free rate (the
+        return arrays are fixed at construction); each call returns a copy.
 
         Returns
         -------
@@ -251,18 +252,15 @@ class PortfolioAnalyzer:
         >>> summary = analyzer.get_summary()
         >>> print(summary)
         """
-        metrics = []
-        cols = [c for c in self.returns.columns if c != "Date"]
-
-        for col in cols:
-            beta = self.calculate_beta(col)
-            up_capture, down_capture = self.calculate_capture_ratios(col)
-            sortino = self.calculate_sortino(col)
-            calmar = self.calculate_calmar(col)
+        cached = self._summary_cache.get(self.rf)
+        if cached is not None:
+            return cast(pd.DataFrame, cached.copy())
 
-            # Total return for reference
-            total_ret = (self.data[col].iloc[-1] / self.data[col].iloc[0] - 1) * 100
+        metrics = []
+        stats = self._compute_all_stats()
 
+        for col, row in zip(self.returns.columns, stats.tolist()):
+            total_ret, beta, up_capture, down_capture, sortino, calmar = row
             metrics.append(
                 {
                     "Strategy": col,
@@ -275,4 +273,111 @@ class PortfolioAnalyzer:
                 }
             )
 
-        return pd.DataFrame(metrics).set_index("Strategy")
+        summary = pd.DataFrame(metrics).set_index("Strategy")
+        self._summary_cache[self.rf] = summary
+        return cast(pd.DataFrame, summary.copy())
+
+    def _strategy_values(self, strategy_col: str) -> np.ndarray:
+        """Portfolio values for one strategy as a (T, 1) NumPy view."""
+        idx = self._col_idx[strategy_col]
+        return self._values_np[:, idx : idx + 1]
+
+    def _strategy_returns(self, strategy_col: str) -> np.ndarray:
+        """Daily returns for one strategy as a (T - 1, 1) NumPy view."""
+        idx = self._col_idx[strategy_col]
+        return self._returns_np[:, idx : idx + 1]
+
+    def _capture_ratios(self, returns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Capture ratios against the cached benchmark regimes."""
+        return _capture_ratios(returns, self._regime_onehot, self._bench_regime_sums)
+
+    def _compute_all_stats(self) -> np.ndarray:
+        """Compute every summary metric for all strategies in one sweep.
+
+        Each metric is a column-wise reduction over the full (T, K) value
+        and return arrays, so there is no per-strategy Python loop.
+
+        Returns
+        -------
+        np.ndarray
+            (K, 6) array of (total_return_pct, beta, up_capture,
+            down_capture, sortino, calmar), rows in ``returns`` column order
+        """
+        values = self._values_np
+        returns = self._returns_np
+        cagr = _cagr(values)
+        up_capture, down_capture = self._capture_ratios(returns)
+        return np.column_stack(
+            [
+                (values[-1] / values[0] - 1) * 100,
+                _beta(returns, self._bench_centered, self._bench_ss),
+                up_capture,
+                down_capture,
+                _sortino(returns, cagr, self.rf),
+                _calmar(values, cagr),
+            ]
+        )
+
+
+# Metric kernels: each reduces a (T, K) array column-wise to a (K,) array.
+
+
+def _cagr(values: np.ndarray) -> np.ndarray:
+    """Annualized return from first and last portfolio values."""
+    n_years = len(values) / 252  # Trading days per year
+    return np.asarray((values[-1] / values[0]) ** (1 / n_years) - 1)
+
+
+def _beta(
+    returns: np.ndarray, bench_centered: np.ndarray, bench_ss: float
+) -> np.ndarray:
+    """Cov(returns, bench) / Var(bench) from a pre-centered benchmark.
+
+    The (n - 1) normalizations cancel, leaving a ratio of two dot products.
+    """
+    if bench_ss == 0:
+        return np.full(returns.shape[1], np.nan)
+    return np.asarray(bench_centered @ (returns - returns.mean(axis=0)) / bench_ss)
+
+
+def _capture_ratios(
+    returns: np.ndarray, regime_onehot: np.ndarray, bench_regime_sums: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Upside and downside capture ratios as percentages.
+
+    One matrix product sums the strategy returns per benchmark regime. Both
+    averages in a regime share its day count, so each capture ratio is a
+    ratio of sums; regimes with no days give NaN.
+    """
+    sums = regime_onehot.T @ returns
+    with np.errstate(invalid="ignore"):
+        down_capture, _, up_capture = sums / bench_regime_sums[:, None] * 100
+    return up_capture, down_capture
+
+
+def _sortino(returns: np.ndarray, cagr: np.ndarray, rf: float) -> np.ndarray:
+    """(CAGR - rf) over the annualized std of negative daily returns.
+
+    The sample std of the negative returns comes from their count, sum and
+    sum of squares, avoiding a boolean-indexed copy. Fewer than two negative
+    returns, or dispersion within the formula's rounding error, give NaN.
+    """
+    neg = np.minimum(returns, 0.0)
+    n_neg = np.count_nonzero(neg, axis=0)
+    neg_sum = neg.sum(axis=0)
+    sum_sq = (neg * neg).sum(axis=0)
+    centered_ss = sum_sq - neg_sum * neg_sum / np.maximum(n_neg, 1)
+
+    defined = (n_neg >= 2) & (centered_ss > n_neg * np.finfo(neg.dtype).eps * sum_sq)
+    downside_var = np.where(defined, centered_ss, np.nan) / np.maximum(n_neg - 1, 1)
+    downside_std = np.sqrt(downside_var) * np.sqrt(252)
+
+    return np.asarray((cagr - rf) / downside_std)
+
+
+def _calmar(values: np.ndarray, cagr: np.ndarray) -> np.ndarray:
+    """CAGR over the absolute maximum drawdown (NaN with no drawdown)."""
+    # values / running peak is 1.0 at every new high, so no drawdown gives 0.0
+    max_drawdown = np.min(values / np.maximum.accumulate(values, axis=0), axis=0) - 1.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(max_drawdown == 0, np.nan, cagr / np.abs(max_drawdown))
@@ -1,72 +1,391 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
 import gurobipy as gp
+import numpy as np
 from gurobipy import GRB
+from scipy.optimize import linprog  # type: ignore[import-untyped]
+
+_GRB_ENV: Optional[gp.Env] = None
+"""Silent Gurobi environment shared by solves that don't pass one."""
+
+
+def _get_env() -> gp.Env:
+    """Return the shared environment, started with OutputFlag=0 on first use.
+
+    Gurobi's default environment writes its license banner to stdout when it
+    starts; starting our own with logging disabled keeps solves silent.
+    """
+    global _GRB_ENV
+    if _GRB_ENV is None:
+        env = gp.Env(empty=True)
+        env.setParam("OutputFlag", 0)
+        env.start()
+        _GRB_ENV = env
+    return _GRB_ENV
+
+
+_SOLUTION_CACHE: Dict[tuple, dict] = {}
+"""Solved LPs keyed by (strikes, premiums, Q, returns, L, backend).
+
+Identical inputs, such as repeated scenario sweeps, skip the solve. Labels,
+the environment and the model name don't affect the solution and are not
+part of the key.
+"""
+
+SOLUTION_CACHE_SIZE = 256
+"""Maximum cached solutions; the oldest entry is evicted first."""
+
+
+def clear_solution_cache() -> None:
+    """Drop all solutions held by the in-process LP cache."""
+    _SOLUTION_CACHE.clear()
 
 
 def solve_fixed_floor_lp(
-    Is: list, S: list, K: dict, p: dict, Q: float, r: dict, L: float, name: str = "Test"
+    Is: list,
+    S: list,
+    K: dict,
+    p: dict,
+    Q: float,
+    r: dict,
+    L: float,
+    name: str = "Test",
+    env: Optional[gp.Env] = None,
+    backend: str = "gurobi",
 ) -> dict:
     """Solve Fixed Floor LP and return solution.
 
+    Parameters
+    ----------
+    env : gp.Env, optional
+        Started Gurobi environment to build the model in. Reusing one
+        environment across many small solves skips per-call environment
+        setup; ``None`` uses a shared silent module-level environment.
+    backend : {"gurobi", "highs"}, optional
+        Solver to use (default: "gurobi"). "highs" solves the same LP with
+        SciPy's bundled HiGHS, which avoids Gurobi's per-model setup and
+        is faster for these few-variable problems.
+
     Returns
     -------
     dict
-        Solution with keys:
+        Fresh copy of the (possibly cached) solution with keys:
         - 'quantities': dict mapping strike labels to quantities
         - 'total_cost': float, total premium cost
         - 'shortfalls': dict mapping scenarios to shortfall amounts
         - 'floor_met': bool, whether floor constraint is satisfied
         - 'status': str, optimization status
+
+    Raises
+    ------
+    ValueError
+        If backend is not "gurobi" or "highs"
     """
-    m = gp.Model(f"portfolio_insurance_{name}")
-    m.Params.OutputFlag = 0
+    solution = solve_fixed_floor_lp_arr(
+        np.fromiter((K[i] for i in Is), dtype=np.float64, count=len(Is)),
+        np.fromiter((p[i] for i in Is), dtype=np.float64, count=len(Is)),
+        Q,
+        np.fromiter((r[s] for s in S), dtype=np.float64, count=len(S)),
+        L,
+        name=name,
+        env=env,
+        backend=backend,
+    )
+    return {
+        **solution,
+        "quantities": dict(zip(Is, solution["quantities"].tolist())),
+        "shortfalls": dict(zip(S, solution["shortfalls"].tolist())),
+    }
 
-    V = {s: Q * (1.0 + r[s]) for s in S}
-    F = Q * (1.0 - L)
 
-    Payoff = {(i, s): max(0.0, K[i] - V[s]) for i in Is for s in S}
+def solve_fixed_floor_lp_arr(
+    K: np.ndarray,
+    p: np.ndarray,
+    Q: float,
+    r: np.ndarray,
+    L: float,
+    name: str = "Test",
+    env: Optional[gp.Env] = None,
+    backend: str = "gurobi",
+) -> dict:
+    """Solve the Fixed Floor LP on positional arrays instead of labeled dicts.
+
+    Parameters
+    ----------
+    K, p : np.ndarray
+        Strikes and premiums, one entry per put.
+    Q : float
+        Portfolio value.
+    r : np.ndarray
+        Scenario returns, one entry per scenario.
+    L : float
+        Maximum tolerated loss; the floor is Q * (1 - L).
+    name, env, backend
+        As in :func:`solve_fixed_floor_lp`.
+
+    Returns
+    -------
+    dict
+        Same keys as :func:`solve_fixed_floor_lp`, except 'quantities' and
+        'shortfalls' are arrays aligned with ``K`` and ``r``.
+
+    Raises
+    ------
+    ValueError
+        If backend is not "gurobi" or "highs"
+    """
+    if backend not in ("gurobi", "highs"):
+        raise ValueError(f"Unknown backend {backend!r}; use 'gurobi' or 'highs'")
+
+    K = np.asarray(K, dtype=np.float64)
+    p = np.asarray(p, dtype=np.float64)
+    r = np.asarray(r, dtype=np.float64)
+
+    cache_key = (tuple(K.tolist()), tuple(p.tolist()), Q, tuple(r.tolist()), L, backend)
+    solution = _SOLUTION_CACHE.get(cache_key)
+    if solution is None:
+        solution = _solve(K, p, Q, r, L, name, env, backend)
+        # Solver errors may be transient (e.g. licensing), so don't cache them
+        if solution["status"] != "error":
+            if len(_SOLUTION_CACHE) >= SOLUTION_CACHE_SIZE:
+                del _SOLUTION_CACHE[next(iter(_SOLUTION_CACHE))]
+            _SOLUTION_CACHE[cache_key] = solution
+
+    return {
+        **solution,
+        "quantities": solution["quantities"].copy(),
+        "shortfalls": solution["shortfalls"].copy(),
+    }
+
+
+def solve_fixed_floor_lp_batch(
+    Is: list,
+    S: list,
+    K: dict,
+    p: dict,
+    Q: float,
+    r: dict,
+    Ls: Sequence[float],
+    name: str = "Test",
+    env: Optional[gp.Env] = None,
+) -> List[dict]:
+    """Solve the Fixed Floor LP for several loss floors on the same market.
+
+    Only the right-hand side of the floor constraints depends on L, so one
+    Gurobi model is built and re-optimized with updated RHS values for each
+    floor, in increasing order. Gurobi warm-starts every re-solve from the
+    previous optimal basis. Results bypass the solution cache.
+
+    Parameters
+    ----------
+    Ls : sequence of float
+        Maximum tolerated losses to solve for.
+    Is, S, K, p, Q, r, name, env
+        As in :func:`solve_fixed_floor_lp`.
+
+    Returns
+    -------
+    list of dict
+        One solution per entry of ``Ls``, in the same order, each shaped as
+        returned by :func:`solve_fixed_floor_lp`.
+    """
+    strikes = np.fromiter((K[i] for i in Is), dtype=np.float64, count=len(Is))
+    premiums = np.fromiter((p[i] for i in Is), dtype=np.float64, count=len(Is))
+    returns = np.fromiter((r[s] for s in S), dtype=np.float64, count=len(S))
+    solutions = _solve_batch(strikes, premiums, Q, returns, Ls, name, env)
+    return [
+        {
+            **solution,
+            "quantities": dict(zip(Is, solution["quantities"].tolist())),
+            "shortfalls": dict(zip(S, solution["shortfalls"].tolist())),
+        }
+        for solution in solutions
+    ]
+
+
+def _solve_batch(
+    K: np.ndarray,
+    p: np.ndarray,
+    Q: float,
+    r: np.ndarray,
+    Ls: Sequence[float],
+    name: str,
+    env: Optional[gp.Env],
+) -> List[dict]:
+    """Solve one LP per floor in Ls, reusing a single Gurobi model."""
+    # b = Q * (1 - L) - V, so each floor is the L = 0 RHS shifted by -Q * L
+    c, A, b0 = _floor_lp_matrices(K, p, Q, r, 0.0)
+    if len(K) == 1 or len(r) == 1:
+        return [_solve_closed_form(c, A, b0 - Q * L) for L in Ls]
+
+    solutions: List[dict] = [{} for _ in Ls]
 
-    x = m.addVars(Is, lb=0.0, name="x")
-    z = m.addVars(S, lb=0.0, name="z")
-    m.setObjective(
-        gp.quicksum(p[i] * x[i] for i in Is) + gp.quicksum(z[s] for s in S),
-        GRB.MINIMIZE,
+    m = gp.Model(
+        f"portfolio_insurance_{name}", env=env if env is not None else _get_env()
     )
+    try:
+        _set_small_lp_params(m)
+        # Dual simplex: a changed RHS leaves the previous basis dual feasible
+        m.Params.Method = 1
+        v = m.addMVar(len(c), lb=0.0, obj=c, name="v")
+        m.ModelSense = GRB.MINIMIZE
+        floor = m.addMConstr(A, v, GRB.GREATER_EQUAL, b0, name="floor_guarantee")
 
-    # Floor constraint with shortfall variable z[s]
-    # V[s] + Payoffs - z[s] >= F  =>  z[s] = shortfall below floor
-    for s in S:
-        m.addConstr(
-            V[s] + gp.quicksum(Payoff[i, s] * x[i] for i in Is) - z[s] >= F,
-            name=f"floor_guarantee[{s}]",
-        )
+        for k in np.argsort(Ls, kind="stable"):
+            floor.RHS = b0 - Q * Ls[k]
+            m.optimize()
+            solutions[k] = _gurobi_solution(m, v, c, len(K), len(r))
+    finally:
+        m.dispose()
+    return solutions
 
-    m.optimize()
 
+def _solve(
+    K: np.ndarray,
+    p: np.ndarray,
+    Q: float,
+    r: np.ndarray,
+    L: float,
+    name: str,
+    env: Optional[gp.Env],
+    backend: str,
+) -> dict:
+    """Build and solve the LP with the chosen backend (no caching)."""
+    c, A, b = _floor_lp_matrices(K, p, Q, r, L)
+    if len(K) == 1 or len(r) == 1:
+        return _solve_closed_form(c, A, b)
+    if backend == "highs":
+        return _solve_highs(c, A, b)
+
+    m = gp.Model(
+        f"portfolio_insurance_{name}", env=env if env is not None else _get_env()
+    )
+    try:
+        _set_small_lp_params(m)
+        # Primal simplex: no barrier/dual race on threads for a tiny model
+        m.Params.Method = 0
+
+        # One MVar for [x, z]; the whole floor block goes in one C call
+        v = m.addMVar(len(c), lb=0.0, obj=c, name="v")
+        m.ModelSense = GRB.MINIMIZE
+        m.addMConstr(A, v, GRB.GREATER_EQUAL, b, name="floor_guarantee")
+
+        m.optimize()
+        return _gurobi_solution(m, v, c, len(K), len(r))
+    finally:
+        m.dispose()
+
+
+def _set_small_lp_params(m: gp.Model) -> None:
+    """Silence the model and skip presolve and threading overhead.
+
+    The floor LP has a handful of variables, so presolve and starting
+    worker threads cost more than they save.
+    """
+    m.Params.OutputFlag = 0
+    m.Params.Presolve = 0
+    m.Params.Threads = 1
+
+
+def _gurobi_solution(
+    m: gp.Model, v: gp.MVar, c: np.ndarray, n_strikes: int, n_scenarios: int
+) -> dict:
+    """Solution dict for an optimized Gurobi model."""
     if m.Status == GRB.OPTIMAL:
-        # Check if floor met in all scenarios (shortfalls near zero)
-        floor_met = all(z[s].X < 1e-4 for s in S)
-
-        # Return solution
-        return {
-            "quantities": {i: x[i].X for i in Is},
-            "total_cost": sum(p[i] * x[i].X for i in Is),
-            "shortfalls": {s: z[s].X for s in S},
-            "floor_met": floor_met,
-            "status": "optimal",
-        }
+        return _optimal_solution(c, np.asarray(v.X), n_strikes)
     elif m.Status == GRB.INFEASIBLE:
-        return {
-            "quantities": dict.fromkeys(Is, 0.0),
-            "total_cost": 0.0,
-            "shortfalls": dict.fromkeys(S, 0.0),
-            "floor_met": False,
-            "status": "infeasible",
-        }
+        return _empty_solution(n_strikes, n_scenarios, "infeasible")
     else:
-        return {
-            "quantities": dict.fromkeys(Is, 0.0),
-            "total_cost": 0.0,
-            "shortfalls": dict.fromkeys(S, 0.0),
-            "floor_met": False,
-            "status": "error",
-        }
+        return _empty_solution(n_strikes, n_scenarios, "error")
+
+
+def _floor_lp_matrices(
+    K: np.ndarray, p: np.ndarray, Q: float, r: np.ndarray, L: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Dense form of the LP: min c @ v  s.t.  A @ v >= b,  v >= 0.
+
+    Variables are stacked as v = [x (strikes), z (shortfalls)]. Each floor
+    constraint V[s] + Payoff[s] @ x - z[s] >= F becomes a row of
+    [Payoff, -I] with right-hand side F - V[s], so z[s] is the shortfall
+    below the floor, penalized one-for-one in the objective.
+    """
+    V = Q * (1.0 + r)
+    F = Q * (1.0 - L)
+
+    c = np.concatenate([p, np.ones(len(r))])
+    A = np.hstack([_payoff_matrix(K, V), -np.eye(len(r))])
+    return c, A, F - V
+
+
+def _solve_closed_form(c: np.ndarray, A: np.ndarray, b: np.ndarray) -> dict:
+    """Exact optimum for a single scenario or a single strike, without a solver.
+
+    With one scenario the floor is a single covering constraint, met most
+    cheaply by the strike with the lowest premium per unit of payoff. With
+    one strike the quantity is the largest ratio of deficit to payoff over
+    the scenarios. Shortfalls carry a positive cost and relax nothing, so
+    they are zero at the optimum; a deficit no strike pays into is
+    infeasible, as in the LP.
+    """
+    n_scenarios = len(b)
+    n = len(c) - n_scenarios
+    premiums, payoff = c[:n], A[:, :n]
+    short = (b > 0) & ~(payoff > 0).any(axis=1)
+    if short.any():
+        return _empty_solution(n, n_scenarios, "infeasible")
+
+    x = np.zeros(n)
+    if n_scenarios == 1:
+        if b[0] > 0:
+            with np.errstate(divide="ignore"):
+                ratio = np.where(payoff[0] > 0, premiums / payoff[0], np.inf)
+            best = int(np.argmin(ratio))
+            x[best] = b[0] / payoff[0, best]
+    else:
+        a = payoff[:, 0]
+        covered = a > 0
+        x[0] = np.max(b[covered] / a[covered], initial=0.0)
+
+    return _optimal_solution(c, np.concatenate([x, np.zeros(n_scenarios)]), n)
+
+
+def _solve_highs(c: np.ndarray, A: np.ndarray, b: np.ndarray) -> dict:
+    """Solve the dense LP with SciPy's HiGHS (constraints passed in <= form)."""
+    res = linprog(c, A_ub=-A, b_ub=-b, bounds=(0, None), method="highs")
+
+    n = len(c) - len(b)
+    if res.status == 0:
+        return _optimal_solution(c, res.x, n)
+    elif res.status == 2:
+        return _empty_solution(n, len(b), "infeasible")
+    else:
+        return _empty_solution(n, len(b), "error")
+
+
+def _optimal_solution(c: np.ndarray, v: np.ndarray, n: int) -> dict:
+    """Solution from the optimal stacked vector [x, z] with n strikes."""
+    x, z = v[:n], v[n:]
+    return {
+        "quantities": x,
+        "total_cost": float(c[:n] @ x),
+        "shortfalls": z,
+        # Floor met in all scenarios when shortfalls are near zero
+        "floor_met": bool(np.all(z < 1e-4)),
+        "status": "optimal",
+    }
+
+
+def _payoff_matrix(strikes: np.ndarray, V: np.ndarray) -> np.ndarray:
+    """Put payoffs max(0, K[i] - V[s]) as an (len(S), len(Is)) array."""
+    return np.asarray(np.maximum(0.0, strikes[None, :] - V[:, None]))
+
+
+def _empty_solution(n_strikes: int, n_scenarios: int, status: str) -> dict:
+    """Zero-quantity solution returned when the LP has no optimum."""
+    return {
+        "quantities": np.zeros(n_strikes),
+        "total_cost": 0.0,
+        "shortfalls": np.zeros(n_scenarios),
+        "floor_met": False,
+        "status": status,
+    }
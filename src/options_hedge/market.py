@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional, cast
+from typing import Optional, TypeVar, cast
 
+import numpy as np
 import pandas as pd
 import yfinance as yf  # type: ignore[import-untyped]
 
@@ -39,6 +40,29 @@ except ImportError:  # pragma: no cover
     OPTION_PRICER_AVAILABLE = False
 
 
+_PriceT = TypeVar("_PriceT", pd.Series, pd.DataFrame)
+
+
+def _daily_returns(close: _PriceT) -> _PriceT:
+    """Simple daily returns of close prices, computed on the NumPy array.
+
+    Equivalent to ``close.ffill().pct_change().fillna(DEFAULT_FILL_VALUE)``
+    without pandas' intermediate objects: missing closes carry the last
+    price forward, so the move across a gap is kept. Works column-wise when
+    yfinance returns one Close column per ticker.
+    """
+    values = close.ffill().to_numpy(dtype=np.float64)
+    returns = np.empty_like(values)
+    returns[:1] = DEFAULT_FILL_VALUE
+    np.divide(values[1:] - values[:-1], values[:-1], out=returns[1:])
+    returns[np.isnan(returns)] = DEFAULT_FILL_VALUE
+
+    if isinstance(close, pd.DataFrame):
+        frame = pd.DataFrame(returns, index=close.index, columns=close.columns)
+        return cast(pd.DataFrame, frame)
+    return cast(pd.Series, pd.Series(returns, index=close.index, name=close.name))
+
+
 @dataclass()
 class Market:
     """Download and store daily OHLCV data and returns for a ticker.
@@ -146,9 +170,7 @@ class Market:
                 )
 
                 # Add Returns column
-                sp500["Returns"] = (
-                    sp500["Close"].pct_change().fillna(DEFAULT_FILL_VALUE)
-                )
+                sp500["Returns"] = _daily_returns(sp500["Close"])
 
                 self.data = sp500
 
@@ -226,11 +248,7 @@ class Market:
             )
 
         self.data = downloaded_data
-        returns = self.data["Close"].pct_change()
-        # Fill first day's return with 0.0
-        tmp_returns = returns.fillna(DEFAULT_FILL_VALUE)  # type: ignore[misc]
-        filled_returns = cast(pd.Series, tmp_returns)
-        self.data["Returns"] = filled_returns
+        self.data["Returns"] = _daily_returns(self.data["Close"])
 
         # Optionally download VIX index and align dates
         if self.fetch_vix:
@@ -5,8 +5,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, Dict, cast
 
 import pandas as pd
 
@@ -17,8 +20,22 @@ DEFAULT_OPTION_QUANTITY = 1
 MIN_OPTION_VALUE = 0.0
 """Minimum option value; options cannot have negative intrinsic value."""
 
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+"""Use __slots__ for Option where dataclasses support it (Python 3.10+)."""
 
-@dataclass
+
+@functools.lru_cache(maxsize=1024)
+def _to_timestamp(expiry: datetime) -> pd.Timestamp:
+    """Convert an expiry to a Timestamp, memoized across Option instances.
+
+    Strategies roll many positions onto the same expiry dates, so repeated
+    conversions become a cache hit. Timestamps are immutable, so sharing one
+    instance between options is safe.
+    """
+    return cast(pd.Timestamp, pd.Timestamp(expiry))
+
+
+@dataclass(**_SLOTS)
 class Option:
     """Simple put option model with intrinsic value only.
 
@@ -47,6 +64,9 @@ class Option:
         Expiration date
     quantity : int
         Number of contracts
+    expiry_ts : pd.Timestamp
+        Expiration date as a Timestamp, converted once at construction so
+        daily expiry checks compare Timestamps directly
 
     Methods
     -------
@@ -62,6 +82,10 @@ class Option:
     premium: float
     expiry: datetime
     quantity: int = DEFAULT_OPTION_QUANTITY
+    expiry_ts: pd.Timestamp = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.expiry_ts = _to_timestamp(self.expiry)
 
     def payoff(self, current_price: float) -> float:
         """Compute intrinsic payoff of put option.
@@ -99,8 +123,7 @@ class Option:
         float
             Option value (0 if expired, intrinsic value otherwise)
         """
-        expiry_date = pd.Timestamp(self.expiry)
-        if current_date >= expiry_date:
+        if current_date >= self.expiry_ts:
             return MIN_OPTION_VALUE
         return max(self.strike - float(current_price), MIN_OPTION_VALUE) * self.quantity
 
@@ -10,9 +10,11 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Optional
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
-from .strategies import estimate_put_premium
+from .strategies import estimate_put_premiums
 
 # Matching tolerances for WRDS data
 DEFAULT_STRIKE_TOLERANCE = 0.05  # 5% tolerance for strike matching
@@ -52,6 +54,8 @@ class OptionPricer:
     -------
     get_put_premium(strike, spot, date, expiry, vix)
         Get put premium (WRDS if available, else synthetic)
+    get_put_premiums(strikes, spots, dates, expiries, vixes)
+        Batch version of get_put_premium over array-like inputs
 
     Examples
     --------
@@ -142,85 +146,131 @@ class OptionPricer:
         - If no match found: Falls back to synthetic pricing
         - Always returns synthetic pricing if use_wrds=False
         """
-        if self.use_wrds and self.wrds_data is not None:
-            premium = self._match_wrds_option(strike, spot, date, expiry)
-            if premium is not None:
-                return premium
-
-        # Fallback to synthetic pricing
-        days = (expiry - date).days
-        return estimate_put_premium(strike, spot, days, vix)
-
-    def _match_wrds_option(
+        return float(
+            self.get_put_premiums(
+                strike,
+                spot,
+                pd.Timestamp(date).to_datetime64(),
+                pd.Timestamp(expiry).to_datetime64(),
+                vix,
+            )
+        )
+
+    def get_put_premiums(
         self,
-        strike: float,
-        spot: float,
-        date: pd.Timestamp,
-        expiry: pd.Timestamp,
-    ) -> Optional[float]:
-        """Match closest available option in WRDS data.
+        strikes: npt.ArrayLike,
+        spots: npt.ArrayLike,
+        dates: npt.ArrayLike,
+        expiries: npt.ArrayLike,
+        vixes: npt.ArrayLike = 20.0,
+    ) -> np.ndarray:
+        """Get put premiums for many options at once.
+
+        Inputs broadcast against each other, so e.g. a single date, spot
+        and VIX can be shared by a whole strike ladder.
 
         Parameters
         ----------
-        strike : float
-            Desired strike price
-        spot : float
-            Current spot price
-        date : pd.Timestamp
-            Current date
-        expiry : pd.Timestamp
-            Desired expiration date
+        strikes, spots : array-like
+            Strike and spot prices in dollars
+        dates, expiries : array-like of datetime-like
+            Purchase and expiration dates
+        vixes : array-like, optional
+            VIX levels for synthetic pricing (default: 20.0)
 
         Returns
         -------
-        float or None
-            Premium as % of spot if match found, None otherwise
-        """
-        if self.wrds_data is None:
-            return None
+        np.ndarray
+            Premiums as fractions of spot, one per broadcast element, equal
+            to calling :meth:`get_put_premium` element by element
 
-        # Filter by date (exact match required)
-        date_filtered = self.wrds_data[self.wrds_data["date"] == date]
-
-        if date_filtered.empty:
-            return None
-
-        # Filter by expiry (within tolerance)
-        expiry_min = expiry - timedelta(days=self.expiry_tolerance_days)
-        expiry_max = expiry + timedelta(days=self.expiry_tolerance_days)
-        expiry_filtered = date_filtered[
-            (date_filtered["exdate"] >= expiry_min)
-            & (date_filtered["exdate"] <= expiry_max)
-        ]
-
-        if expiry_filtered.empty:
-            return None
-
-        # Find closest strike (within tolerance)
-        strike_min = strike * (1 - self.strike_tolerance)
-        strike_max = strike * (1 + self.strike_tolerance)
-        strike_filtered = expiry_filtered[
-            (expiry_filtered["strike_price"] >= strike_min)
-            & (expiry_filtered["strike_price"] <= strike_max)
-        ]
+        Notes
+        -----
+        Synthetic premiums are computed in one vectorized pass. In WRDS
+        mode the data is filtered to the requested dates once and matched
+        one date at a time, and only elements without a match keep the
+        synthetic price.
+        """
+        strike, spot, vix, date, expiry = np.broadcast_arrays(
+            np.asarray(strikes, dtype=np.float64),
+            np.asarray(spots, dtype=np.float64),
+            np.asarray(vixes, dtype=np.float64),
+            np.asarray(dates, dtype="datetime64[ns]"),
+            np.asarray(expiries, dtype="datetime64[ns]"),
+        )
+        days = (expiry - date) // np.timedelta64(1, "D")
+        premiums = estimate_put_premiums(strike, spot, days, vix)
 
-        if strike_filtered.empty:
-            return None
+        if self.use_wrds and self.wrds_data is not None:
+            matched = self._match_wrds_options(strike, spot, date, expiry)
+            premiums = np.where(np.isnan(matched), premiums, matched)
 
-        # Find best match (closest strike)
-        strike_filtered = strike_filtered.copy()
-        strike_filtered["strike_diff"] = abs(strike_filtered["strike_price"] - strike)
-        best_match = strike_filtered.nsmallest(1, "strike_diff")
+        return premiums
 
-        # Calculate mid-price (average of bid/ask)
-        bid = best_match["best_bid"].iloc[0]
-        offer = best_match["best_offer"].iloc[0]
-        mid_price = (bid + offer) / 2.0
+    def _match_wrds_options(
+        self,
+        strike: np.ndarray,
+        spot: np.ndarray,
+        date: np.ndarray,
+        expiry: np.ndarray,
+    ) -> np.ndarray:
+        """Match the closest available option in WRDS data for each element.
 
-        # Convert to premium as % of spot (for consistency with synthetic)
-        premium_pct = mid_price / spot
+        Parameters
+        ----------
+        strike, spot : np.ndarray
+            Desired strike and current spot prices
+        date, expiry : np.ndarray
+            Purchase and desired expiration dates as ``datetime64[ns]``;
+            all four arrays share one shape
 
-        return float(premium_pct)
+        Returns
+        -------
+        np.ndarray
+            Premium as % of spot where a match is found, NaN otherwise
+        """
+        matched = np.full(strike.shape, np.nan)
+        if self.wrds_data is None:
+            return matched
+
+        flat = matched.reshape(-1)
+        dates = date.reshape(-1)
+        strikes = strike.reshape(-1)
+        spots = spot.reshape(-1)
+        expiries = expiry.reshape(-1)
+        tolerance = np.timedelta64(self.expiry_tolerance_days, "D")
+
+        # Filter by date (exact match required), once for all elements
+        wanted = self.wrds_data[self.wrds_data["date"].isin(np.unique(dates))]
+
+        for day, rows in wanted.groupby("date", sort=False):
+            idx = np.flatnonzero(dates == np.datetime64(day, "ns"))
+            exdate = rows["exdate"].to_numpy(dtype="datetime64[ns]")
+            available = rows["strike_price"].to_numpy(dtype=np.float64)
+            # Calculate mid-price (average of bid/ask)
+            mid_price = (
+                rows["best_bid"].to_numpy(dtype=np.float64)
+                + rows["best_offer"].to_numpy(dtype=np.float64)
+            ) / 2.0
+
+            # (elements, rows) masks: expiry and strike within tolerance
+            wanted_strike = strikes[idx, None]
+            ok = (
+                (np.abs(exdate - expiries[idx, None]) <= tolerance)
+                & (available >= wanted_strike * (1 - self.strike_tolerance))
+                & (available <= wanted_strike * (1 + self.strike_tolerance))
+            )
+
+            # Best match is the closest strike; ties keep the first row
+            strike_diff = np.where(ok, np.abs(available - wanted_strike), np.inf)
+            best = strike_diff.argmin(axis=1)
+            found = ok.any(axis=1)
+
+            # Convert to premium as % of spot (for consistency with synthetic)
+            hit = idx[found]
+            flat[hit] = mid_price[best[found]] / spots[hit]
+
+        return matched
 
     def get_available_strikes(
         self,
@@ -204,18 +204,18 @@ class Portfolio:
         current_date : pd.Timestamp
             Current date for expiry checks
         """
-        expired: List[Option] = []
+        # Single pass: settle expired options and keep the rest
+        remaining: List[Option] = []
         for opt in self.options:
-            expiry_ts = pd.Timestamp(opt.expiry)
-            if current_date >= expiry_ts:
+            if current_date >= opt.expiry_ts:
                 # Realize payoff for ITM options (put: strike > current_price)
                 payoff = opt.payoff(current_price)
                 if payoff > 0:
                     self.cash += payoff
-                expired.append(opt)
+            else:
+                remaining.append(opt)
 
-        # Remove all expired options
-        self.options = [o for o in self.options if o not in expired]
+        self.options = remaining
 
     def check_early_exercise(
         self,
@@ -7,6 +7,8 @@
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from .fixed_floor_lp import solve_fixed_floor_lp
@@ -71,7 +73,8 @@ def estimate_put_premium(
         vix: VIX level (volatility index, typically 10-80)
 
     Returns:
-        Premium as fraction of spot price (e.g., 0.02 = 2% of notional)
+        Premium as fraction of spot price (e.g., 0.02 = 2% of notional).
+        Negative ``days_to_expiry`` is treated as 0.
 
     Examples:
         >>> estimate_put_premium(3400, 4000, 90, vix=20)
@@ -79,24 +82,70 @@ def estimate_put_premium(
         >>> estimate_put_premium(3400, 4000, 90, vix=60)
         0.045  # ~4.5% of notional (3x higher due to crisis vol)
     """
+    return float(estimate_put_premiums(strike, spot, days_to_expiry, vix))
+
+
+def estimate_put_premiums(
+    strikes: npt.ArrayLike,
+    spots: npt.ArrayLike,
+    days_to_expiry: npt.ArrayLike,
+    vix: npt.ArrayLike = DEFAULT_VIX_FOR_PRICING,
+) -> np.ndarray:
+    """Vectorized :func:`estimate_put_premium` over array-like inputs.
+
+    Inputs broadcast against each other, so a scalar spot or VIX can be
+    shared by many strikes. Negative days to expiry are clipped to 0.
+
+    Args:
+        strikes: Strike prices
+        spots: Current spot prices
+        days_to_expiry: Days until expiration
+        vix: VIX levels
+
+    Returns:
+        Premiums as fractions of spot, with the broadcast shape of the inputs
+    """
+    strike, spot, days, vol = np.broadcast_arrays(
+        *(
+            np.asarray(a, dtype=np.float64)
+            for a in (strikes, spots, days_to_expiry, vix)
+        )
+    )
     moneyness = strike / spot
-    implied_vol = vix / 100.0  # VIX is in percentage points
-    time_factor = (days_to_expiry / 365.0) ** 0.5
-
-    if moneyness < 1.0:  # OTM put
-        # Premium ~ distance × vol × sqrt(time)
-        # Scaling factor 0.4 calibrated to match SPX OTM put prices
-        # (e.g., 15% OTM, 90 days, VIX=20 → ~0.8% of notional)
-        distance = 1.0 - moneyness
-        premium_pct = distance * implied_vol * time_factor * 0.4
-    else:  # ITM put
-        # Intrinsic + time value
-        intrinsic_pct = (strike - spot) / spot
-        time_value_pct = implied_vol * time_factor * 0.1
-        premium_pct = intrinsic_pct + time_value_pct
+    implied_vol = vol / 100.0  # VIX is in percentage points
+    time_factor = np.sqrt(np.maximum(days, 0.0) / 365.0)
+
+    # OTM put: premium ~ distance × vol × sqrt(time)
+    # Scaling factor 0.4 calibrated to match SPX OTM put prices
+    # (e.g., 15% OTM, 90 days, VIX=20 → ~0.8% of notional)
+    otm_premium = (1.0 - moneyness) * implied_vol * time_factor * 0.4
+    # ITM put: intrinsic + time value
+    itm_premium = (strike - spot) / spot + implied_vol * time_factor * 0.1
+    premium_pct = np.where(moneyness < 1.0, otm_premium, itm_premium)
 
     # Floor at 0.1% (minimum for transaction costs)
-    return float(max(premium_pct, 0.001))
+    return np.asarray(np.maximum(premium_pct, 0.001))
+
+
+def _lookup_vix(
+    market: MarketLike, date: pd.Timestamp, params: Dict[str, Any]
+) -> float:
+    """Return the market VIX for a date, or the pricing default.
+
+    The market's ``get_vix`` bound method (or None if it has none) is
+    resolved on the first call for each market and cached in ``params``
+    so later calls in the same run skip the attribute probe.
+    """
+    if params.get("_vix_market") is not market:
+        params["_get_vix"] = getattr(market, "get_vix", None)
+        params["_vix_market"] = market
+    get_vix = params["_get_vix"]
+    if get_vix is None:
+        return DEFAULT_VIX_FOR_PRICING
+    try:
+        return float(get_vix(date))
+    except (KeyError, AttributeError):
+        return DEFAULT_VIX_FOR_PRICING
 
 
 def quarterly_protective_put_strategy(
@@ -127,12 +176,7 @@ def quarterly_protective_put_strategy(
         strike = current_price * strike_ratio
 
         # Get VIX for realistic pricing
-        current_vix = DEFAULT_VIX_FOR_PRICING
-        if hasattr(market, "get_vix"):
-            try:
-                current_vix = market.get_vix(pd.Timestamp(current_date))
-            except (KeyError, AttributeError):
-                pass
+        current_vix = _lookup_vix(market, pd.Timestamp(current_date), params)
 
         # Estimate premium based on VIX and moneyness
         premium_pct = estimate_put_premium(
@@ -204,21 +248,12 @@ def conditional_hedging_strategy(
     vol_spike_trigger = recent_vol > vol_multiplier * long_term_vol
     risk_trigger = price_drop_trigger or vol_spike_trigger
 
-    active_puts = [
-        o
-        for o in portfolio.options
-        if pd.Timestamp(o.expiry) > pd.Timestamp(current_date)
-    ]
+    active_puts = [o for o in portfolio.options if o.expiry_ts > ts_date]
     if risk_trigger and not active_puts:
         strike = current_price * strike_ratio
 
         # Get VIX for realistic pricing
-        current_vix = DEFAULT_VIX_FOR_PRICING
-        if hasattr(market, "get_vix"):
-            try:
-                current_vix = market.get_vix(pd.Timestamp(current_date))
-            except (KeyError, AttributeError):
-                pass
+        current_vix = _lookup_vix(market, ts_date, params)
 
         # Estimate premium based on VIX and moneyness
         premium_pct = estimate_put_premium(
@@ -257,7 +292,6 @@ def vix_ladder_strategy(
     params : dict
         Strategy parameters:
         - vix : float (optional, extracted from market if not provided)
-        - sigma : float (default 0.15)
         - expiry_days : int (default 90)
         - alpha : float (default 0.05, nuclear hedge protection)
         - ladder_budget_allocations : list of tuples
@@ -308,13 +342,17 @@ def vix_ladder_strategy(
     if "last_lp_hedge" not in params:
         params["last_lp_hedge"] = None
 
-    # Compute sigma for LP
-    sigma_val = market.data["Close"].pct_change().std()
-    sigma = (
-        sigma_val.item()  # type: ignore[union-attr]
-        if hasattr(sigma_val, "item")
-        else float(sigma_val)
-    ) * (252**0.5)
+    # Compute sigma for LP once per market; it is a property of the whole
+    # price series, so later hedge dates on the same market reuse it.
+    if params.get("_sigma_market") is not market:
+        sigma_val = market.data["Close"].pct_change().std()
+        params["_sigma"] = (
+            sigma_val.item()  # type: ignore[union-attr]
+            if hasattr(sigma_val, "item")
+            else float(sigma_val)
+        ) * (ANNUAL_TRADING_DAYS**0.5)
+        params["_sigma_market"] = market
+    sigma = params["_sigma"]
 
     # Calculate portfolio value
     V0 = portfolio.equity_value + portfolio.cash
@@ -426,11 +464,10 @@ def vix_ladder_strategy(
 
                 if verbose:
                     otm_pct = ((strike - current_price) / current_price) * 100
-                    days_to_exp = (expiry_date - current_date).days
                     print(
                         f"  🛡️  Bought {quantity:.2f} put(s): "
                         f"K=${strike:.2f} ({otm_pct:+.1f}% OTM), "
-                        f"exp={expiry_date.date()} ({days_to_exp}d), "
+                        f"exp={expiry_date.date()} ({expiry_days}d), "
                         f"cost=${premium * quantity:,.2f}"
                     )
             except ValueError:
@@ -512,12 +549,7 @@ def fixed_floor_lp_strategy(
         return {"total_cost": 0.0, "action": "skipped"}
 
     # Get VIX for realistic pricing
-    current_vix = DEFAULT_VIX_FOR_PRICING
-    if hasattr(market, "get_vix"):
-        try:
-            current_vix = market.get_vix(pd.Timestamp(current_date))
-        except (KeyError, AttributeError):
-            pass
+    current_vix = _lookup_vix(market, pd.Timestamp(current_date), params)
 
     # Build inputs for LP solver
     Q = portfolio.equity_value + portfolio.cash  # Total portfolio value
@@ -630,12 +662,11 @@ def fixed_floor_lp_strategy(
 
                 if verbose:
                     otm_pct = ((strike - current_price) / current_price) * 100
-                    days_to_exp = (expiry_date - current_date).days
                     print(
                         f"  🛡️  Bought {quantity:.2f} put(s): "
                         f"K=${strike:.2f} "
                         f"({otm_pct:+.1f}% {'OTM' if otm_pct < 0 else 'ITM'}), "
-                        f"exp={expiry_date.date()} ({days_to_exp}d), "
+                        f"exp={expiry_date.date()} ({expiry_days}d), "
                         f"cost=${premium * quantity:,.2f}"
                     )
             except ValueError as e:
@@ -9,6 +9,8 @@ API:
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 # Constants
 DEFAULT_ALPHA = 0.05
 
@@ -37,6 +39,47 @@ __all__ = [
 ]
 
 
+def _allocate_cheapest_per_rung(
+    c: np.ndarray, bucket: np.ndarray, budget_fracs: np.ndarray, total_budget: float
+) -> Tuple[np.ndarray, float]:
+    """Solve the ladder LP by spending each rung's minimum on its cheapest option.
+
+    The LP minimizes c·x subject to c·x <= total_budget and a minimum spend
+    per rung. Every allocation that meets each rung minimum exactly attains
+    the lower bound on cost, so the optimum is closed-form.
+
+    Args:
+        c: Per-unit option costs including transaction costs
+        bucket: Rung index of each option (out-of-range means no rung)
+        budget_fracs: Fraction of total_budget required in each rung
+        total_budget: Total hedge budget
+
+    Returns:
+        (quantities, total_cost), where total_cost is the sum of the funded
+        rung minimums
+    """
+    x_sol = np.zeros(len(c))
+
+    # Sort by (rung, cost); the first entry of each rung is its cheapest
+    # option, with ties going to the lowest index since lexsort is stable
+    order = np.lexsort((c, bucket))
+    sorted_bucket = bucket[order]
+    is_first = np.ones(len(order), dtype=bool)
+    is_first[1:] = sorted_bucket[1:] != sorted_bucket[:-1]
+    cheapest = order[is_first]
+    rungs = sorted_bucket[is_first]
+
+    in_ladder = (rungs >= 0) & (rungs < len(budget_fracs))
+    cheapest, rungs = cheapest[in_ladder], rungs[in_ladder]
+    fracs = budget_fracs[rungs]
+    funded = fracs > 0
+    cheapest, fracs = cheapest[funded], fracs[funded]
+
+    rung_spend = total_budget * fracs
+    x_sol[cheapest] = rung_spend / c[cheapest]
+    return x_sol, float(rung_spend.sum())
+
+
 def solve_vix_ladder_lp(
     options: List[PutOption],
     V0: float,
@@ -54,7 +97,7 @@ def solve_vix_ladder_lp(
     Instead of complex floor-based constraints, this uses a simple approach:
     - Budget = f(VIX, beta) × V0
     - Enforce minimum spend in each strike ladder rung
-    - Let LP optimize within those constraints
+    - Solve the resulting LP in closed form (cheapest option per rung)
 
     This creates graduated protection across strike levels, with total budget
     scaling with market volatility and portfolio risk.
@@ -112,8 +155,13 @@ def solve_vix_ladder_lp(
     beta_factor = max(1.0, beta)  # Higher beta = more risk = more budget
     total_budget = V0 * base_budget_pct * vix_factor * beta_factor
 
+    # Unpack option fields into contiguous arrays once
+    n = len(options)
+    strikes = np.fromiter((opt.strike for opt in options), dtype=np.float64, count=n)
+    premiums = np.fromiter((opt.premium for opt in options), dtype=np.float64, count=n)
+
     # Setup option costs with transaction costs
-    c = [opt.premium * (1 + transaction_cost_rate) for opt in options]
+    c = premiums * (1 + transaction_cost_rate)
 
     # Ladder rungs by OTM percentage
     ladder_rungs = [
@@ -123,80 +171,15 @@ def solve_vix_ladder_lp(
         ("catastrophic", 0.40, 1.0),  # 40%+ OTM
     ]
 
-    # Categorize options into rungs
-    rung_indices: List[List[int]] = [[] for _ in range(4)]
-    for j, opt in enumerate(options):
-        otm_pct = (S0 - opt.strike) / S0
-        for k, (_, otm_min, otm_max) in enumerate(ladder_rungs):
-            if otm_min <= otm_pct < otm_max:
-                rung_indices[k].append(j)
-                break
-
-    # Try Gurobi first
-    try:  # pragma: no cover
-        import gurobipy as gp
-        from gurobipy import GRB
-
-        m = gp.Model("vix_ladder_lp")
-        m.Params.OutputFlag = 0
-
-        x_vars = [m.addVar(lb=0.0, name=f"x_{k}") for k in range(len(options))]
-
-        # Objective: minimize total cost
-        m.setObjective(
-            gp.quicksum(c[j] * x_vars[j] for j in range(len(options))),
-            GRB.MINIMIZE,
-        )
-
-        # Constraint: total budget limit
-        m.addConstr(
-            gp.quicksum(c[j] * x_vars[j] for j in range(len(options))) <= total_budget,
-            name="budget_limit",
-        )
-
-        # Ladder constraints: minimum spend in each rung
-        for k, (name, _, _) in enumerate(ladder_rungs):
-            budget_frac = budget_fracs[k]
-            if rung_indices[k] and budget_frac > 0:
-                min_spend = total_budget * budget_frac
-                m.addConstr(
-                    gp.quicksum(c[j] * x_vars[j] for j in rung_indices[k]) >= min_spend,
-                    name=f"ladder_{name}",
-                )
-
-        m.optimize()
-
-        if m.Status == GRB.OPTIMAL:
-            x_sol = [x_vars[j].X for j in range(len(options))]
-            total_cost = sum(c[j] * x_sol[j] for j in range(len(options)))
-            return x_sol, total_cost, total_budget
-        else:
-            # Fall through to greedy
-            pass
-
-    except ImportError:
-        pass
-
-    # Greedy fallback: allocate budget proportionally to ladder requirements
-    x_sol = [0.0] * len(options)
-
-    for k, (_name, _, _) in enumerate(ladder_rungs):
-        budget_frac = budget_fracs[k]
-        if not rung_indices[k] or budget_frac <= 0:
-            continue
-
-        rung_budget = total_budget * budget_frac
-        # Sort options in this rung by premium (cheapest first)
-        rung_opts = sorted(rung_indices[k], key=lambda j: c[j])
-
-        spent = 0.0
-        for j in rung_opts:
-            if spent >= rung_budget:
-                break
-            # Buy as many as budget allows
-            quantity = (rung_budget - spent) / c[j]
-            x_sol[j] = quantity
-            spent += c[j] * quantity
-
-    total_cost = sum(c[j] * x_sol[j] for j in range(len(options)))
-    return x_sol, total_cost, total_budget
+    # Categorize options into rungs: bucket k holds edges[k] <= otm < edges[k+1]
+    otm_pct = (S0 - strikes) / S0
+    edges = np.array([ladder_rungs[0][1]] + [otm_max for _, _, otm_max in ladder_rungs])
+    bucket = np.searchsorted(edges, otm_pct, side="right") - 1
+
+    x_sol, total_cost = _allocate_cheapest_per_rung(
+        c,
+        bucket,
+        np.asarray(budget_fracs[: len(ladder_rungs)], dtype=np.float64),
+        total_budget,
+    )
+    return x_sol.tolist(), total_cost, total_budget
@@ -6,9 +6,12 @@ OptionMetrics data for use in backtesting strategies.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Sequence, Tuple, cast
 
 import pandas as pd
 
@@ -19,34 +22,197 @@ try:
 except ImportError:  # pragma: no cover
     CRYPTO_AVAILABLE = False
 
+try:
+    import pyarrow  # type: ignore[import-untyped]  # noqa: F401
 
-def load_encrypted_wrds_data(
-    encrypted_path: Optional[str] = None, key: Optional[str] = None
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    PYARROW_AVAILABLE = False
+
+OPTION_DTYPES: Dict[str, str] = {
+    "cp_flag": "category",
+    "best_bid": "float32",
+    "best_offer": "float32",
+    "impl_volatility": "float32",
+    "delta": "float32",
+}
+"""Compact dtypes applied while parsing option chains.
+
+strike_price stays float64 because it is matched and divided by spot to
+build strike ratios.
+"""
+
+OPTION_COUNT_COLUMNS: Tuple[str, ...] = ("volume", "open_interest")
+"""Option chain count columns downcast to the smallest signed integer type."""
+
+WRDS_OPTION_COLUMNS: Tuple[str, ...] = (
+    "date",
+    "exdate",
+    "strike_price",
+    "cp_flag",
+    "best_bid",
+    "best_offer",
+    "impl_volatility",
+    "delta",
+    "volume",
+    "open_interest",
+)
+"""Columns load_encrypted_wrds_data parses by default."""
+
+_DECRYPTED_CACHE: Dict[str, pd.DataFrame] = {}
+"""Decoded DataFrames keyed by SHA-256 of (ciphertext, key, parse options).
+
+Skips Fernet decryption, gzip decompression and CSV parsing when the same
+encrypted file is loaded again in one process. Nothing is written to disk,
+so the data stays encrypted at rest.
+"""
+
+DECRYPTED_CACHE_SIZE = 4
+"""Maximum cached DataFrames; the oldest entry is evicted first."""
+
+
+def clear_decrypted_cache() -> None:
+    """Drop all decoded DataFrames held by the in-process load cache."""
+    _DECRYPTED_CACHE.clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_cipher(key: str) -> Fernet:
+    """Return a Fernet cipher for ``key``, reused across loads."""
+    return Fernet(key.encode())
+
+
+def _cached_decrypt_load(
+    token: bytes,
+    key: str,
+    date_cols: Tuple[str, ...],
+    dtype: Optional[Dict[str, str]] = None,
+    downcast_cols: Tuple[str, ...] = (),
+    usecols: Optional[Tuple[str, ...]] = None,
 ) -> pd.DataFrame:
-    """Load and decrypt WRDS option data.
+    """Decrypt, decompress and parse an encrypted CSV, memoizing the result.
+
+    Parameters
+    ----------
+    token : bytes
+        Contents of the Fernet-encrypted, gzip-compressed CSV file
+    key : str
+        Fernet encryption key
+    date_cols : tuple of str
+        Columns to parse as datetime
+    dtype : dict, optional
+        Column dtypes applied during parsing (missing columns are ignored)
+    downcast_cols : tuple of str, optional
+        Integer columns to downcast to the smallest signed type after
+        parsing
+    usecols : tuple of str, optional
+        Columns to parse. If None, all columns are parsed
+
+    Returns
+    -------
+    pd.DataFrame
+        Decoded data as a deep copy, so callers may modify it freely
+        without affecting the cached frame.
+
+    Raises
+    ------
+    ValueError
+        If decryption fails
+    """
+    digest = hashlib.sha256(token)
+    digest.update(key.encode())
+    digest.update(repr((date_cols, dtype, downcast_cols, usecols)).encode())
+    cache_key = digest.hexdigest()
+    cached = _DECRYPTED_CACHE.get(cache_key)
+    if cached is not None:
+        return cast(pd.DataFrame, cached.copy())
+
+    cipher = _get_cipher(key)
+    try:
+        plaintext = cipher.decrypt(token)
+    except Exception as e:
+        raise ValueError(
+            f"Decryption failed: {e}\n"
+            "Check that WRDS_DATA_KEY matches the original encryption key"
+        ) from e
+
+    # Load into DataFrame, parsing date columns during the read. Letting the
+    # reader handle gzip decompresses the stream incrementally as it parses
+    # rather than materializing the whole CSV up front. Prefer pyarrow's
+    # multithreaded CSV reader when it is installed.
+    buffer = io.BytesIO(plaintext)
+    parse_dates = [c for c in date_cols if usecols is None or c in usecols]
+    usecols_list = None if usecols is None else list(usecols)
+    if PYARROW_AVAILABLE:
+        data = pd.read_csv(
+            buffer,
+            compression="gzip",
+            engine="pyarrow",
+            parse_dates=parse_dates,
+            dtype=dtype,
+            usecols=usecols_list,
+        )
+    else:
+        data = pd.read_csv(
+            buffer,
+            compression="gzip",
+            low_memory=False,
+            parse_dates=parse_dates,
+            dtype=dtype,
+            usecols=usecols_list,
+        )
+
+    for col in downcast_cols:
+        if col in data.columns:
+            data[col] = pd.to_numeric(data[col], downcast="integer")
+
+    if len(_DECRYPTED_CACHE) >= DECRYPTED_CACHE_SIZE:
+        del _DECRYPTED_CACHE[next(iter(_DECRYPTED_CACHE))]
+    _DECRYPTED_CACHE[cache_key] = data
+    return cast(pd.DataFrame, data.copy())
+
+
+def _load_encrypted(
+    default_filename: str,
+    date_cols: Tuple[str, ...],
+    encrypted_path: Optional[str],
+    key: Optional[str],
+    label: str,
+    loader_name: str,
+    not_found_hint: str = "",
+    dtype: Optional[Dict[str, str]] = None,
+    downcast_cols: Tuple[str, ...] = (),
+    usecols: Optional[Tuple[str, ...]] = None,
+) -> pd.DataFrame:
+    """Resolve the path and key for an encrypted dataset and load it.
 
     Parameters
     ----------
+    default_filename : str
+        File name under ``data/`` used when ``encrypted_path`` is None
+    date_cols : tuple of str
+        Columns to parse as datetime
     encrypted_path : str, optional
-        Path to encrypted data file. If None, uses default location
-        (data/wrds_spx_options.enc)
+        Path to encrypted data file
     key : str, optional
         Encryption key. If None, reads from WRDS_DATA_KEY environment variable
+    label : str
+        Dataset name used in the missing-file error
+    loader_name : str
+        Public loader name used in the missing-key error
+    not_found_hint : str, optional
+        Extra line appended to the missing-file error
+    dtype : dict, optional
+        Column dtypes applied during parsing
+    downcast_cols : tuple of str, optional
+        Integer columns downcast to the smallest signed type
+    usecols : tuple of str, optional
+        Columns to parse. If None, all columns are parsed
 
     Returns
     -------
     pd.DataFrame
-        Decrypted WRDS option data with columns:
-        - date: Trading date
-        - exdate: Expiration date
-        - strike_price: Strike price in dollars
-        - cp_flag: 'P' for puts
-        - best_bid: Best bid price
-        - best_offer: Best offer price
-        - impl_volatility: Implied volatility
-        - delta: Option delta
-        - volume: Daily volume
-        - open_interest: Open interest
+        Decrypted data
 
     Raises
     ------
@@ -56,15 +222,6 @@ def load_encrypted_wrds_data(
         If encrypted file not found
     ValueError
         If decryption key not provided or decryption fails
-
-    Examples
-    --------
-    >>> # Load with default paths and env var key
-    >>> data = load_encrypted_wrds_data()
-    >>> len(data)
-    300000
-    >>> # Load with custom key
-    >>> data = load_encrypted_wrds_data(key="my-secret-key")
     """
     if not CRYPTO_AVAILABLE:  # pragma: no cover
         raise ImportError(
@@ -74,13 +231,16 @@ def load_encrypted_wrds_data(
     # Default encrypted file path
     if encrypted_path is None:
         project_root = Path(__file__).parent.parent.parent
-        encrypted_path = str(project_root / "data" / "wrds_spx_options.enc")
+        encrypted_path = str(project_root / "data" / default_filename)
 
-    if not Path(encrypted_path).exists():
+    # Reading the file is the existence check, done before the key check
+    # so a missing file is reported as such even without a key
+    try:
+        token = Path(encrypted_path).read_bytes()
+    except FileNotFoundError as e:
         raise FileNotFoundError(
-            f"Encrypted WRDS data not found: {encrypted_path}\n"
-            "Run scripts/download_wrds_data.py to download and encrypt data."
-        )
+            f"Encrypted {label} not found: {encrypted_path}{not_found_hint}"
+        ) from e
 
     # Get decryption key
     if key is None:
@@ -90,35 +250,78 @@ def load_encrypted_wrds_data(
         raise ValueError(
             "Decryption key not provided. Either:\n"
             "1. Set WRDS_DATA_KEY environment variable, or\n"
-            '2. Pass key parameter: load_encrypted_wrds_data(key="...")'
+            f'2. Pass key parameter: {loader_name}(key="...")'
         )
 
-    # Decrypt data
-    cipher = Fernet(key.encode())
+    return _cached_decrypt_load(token, key, date_cols, dtype, downcast_cols, usecols)
 
-    with open(encrypted_path, "rb") as f:
-        ciphertext = f.read()
 
-    try:
-        plaintext = cipher.decrypt(ciphertext)
-    except Exception as e:
-        raise ValueError(
-            f"Decryption failed: {e}\n"
-            "Check that WRDS_DATA_KEY matches the original encryption key"
-        ) from e
+def load_encrypted_wrds_data(
+    encrypted_path: Optional[str] = None,
+    key: Optional[str] = None,
+    columns: Optional[Sequence[str]] = WRDS_OPTION_COLUMNS,
+) -> pd.DataFrame:
+    """Load and decrypt WRDS option data.
 
-    # Load into DataFrame
-    import gzip
-    import io
+    Parameters
+    ----------
+    encrypted_path : str, optional
+        Path to encrypted data file. If None, uses default location
+        (data/wrds_spx_options.enc)
+    key : str, optional
+        Encryption key. If None, reads from WRDS_DATA_KEY environment variable
+    columns : sequence of str, optional
+        Columns to parse (default: the columns listed below). Pass None to
+        keep every column in the file
 
-    decompressed = gzip.decompress(plaintext)
-    data = pd.read_csv(io.BytesIO(decompressed), low_memory=False)
+    Returns
+    -------
+    pd.DataFrame
+        Decrypted WRDS option data with columns:
+        - date: Trading date
+        - exdate: Expiration date
+        - strike_price: Strike price in dollars
+        - cp_flag: 'P' for puts
+        - best_bid: Best bid price
+        - best_offer: Best offer price
+        - impl_volatility: Implied volatility
+        - delta: Option delta
+        - volume: Daily volume
+        - open_interest: Open interest
 
-    # Convert date columns to datetime
-    data["date"] = pd.to_datetime(data["date"])
-    data["exdate"] = pd.to_datetime(data["exdate"])
+    Raises
+    ------
+    ImportError
+        If cryptography library not installed
+    FileNotFoundError
+        If encrypted file not found
+    ValueError
+        If decryption key not provided, decryption fails, or a requested
+        column is missing from the file
 
-    return data
+    Examples
+    --------
+    >>> # Load with default paths and env var key
+    >>> data = load_encrypted_wrds_data()
+    >>> len(data)
+    300000
+    >>> # Load with custom key
+    >>> data = load_encrypted_wrds_data(key="my-secret-key")
+    """
+    return _load_encrypted(
+        "wrds_spx_options.enc",
+        ("date", "exdate"),
+        encrypted_path,
+        key,
+        label="WRDS data",
+        loader_name="load_encrypted_wrds_data",
+        not_found_hint=(
+            "\nRun scripts/download_wrds_data.py to download and encrypt data."
+        ),
+        dtype=OPTION_DTYPES,
+        downcast_cols=OPTION_COUNT_COLUMNS,
+        usecols=None if columns is None else tuple(columns),
+    )
 
 
 def load_encrypted_sp500_data(
@@ -143,45 +346,14 @@ def load_encrypted_sp500_data(
         - volume: Trading volume
         - return: Daily returns
     """
-    if not CRYPTO_AVAILABLE:  # pragma: no cover
-        raise ImportError(
-            "cryptography library not installed. Install with: pip install cryptography"
-        )
-
-    if encrypted_path is None:
-        project_root = Path(__file__).parent.parent.parent
-        encrypted_path = str(project_root / "data" / "wrds_sp500.enc")
-
-    if not Path(encrypted_path).exists():
-        raise FileNotFoundError(f"Encrypted S&P 500 data not found: {encrypted_path}")
-
-    if key is None:
-        key = os.environ.get("WRDS_DATA_KEY")
-
-    if not key:
-        raise ValueError(
-            "Decryption key not provided. Either:\n"
-            "1. Set WRDS_DATA_KEY environment variable, or\n"
-            '2. Pass key parameter: load_encrypted_sp500_data(key="...")'
-        )
-
-    cipher = Fernet(key.encode())
-    with open(encrypted_path, "rb") as f:
-        ciphertext = f.read()
-
-    try:
-        plaintext = cipher.decrypt(ciphertext)
-    except Exception as e:
-        raise ValueError(f"Decryption failed: {e}") from e
-
-    import gzip
-    import io
-
-    decompressed = gzip.decompress(plaintext)
-    data = pd.read_csv(io.BytesIO(decompressed))
-    data["date"] = pd.to_datetime(data["date"])
-
-    return data
+    return _load_encrypted(
+        "wrds_sp500.enc",
+        ("date",),
+        encrypted_path,
+        key,
+        label="S&P 500 data",
+        loader_name="load_encrypted_sp500_data",
+    )
 
 
 def load_encrypted_vix_data(
@@ -204,45 +376,14 @@ def load_encrypted_vix_data(
         - date: Trading date
         - open, high, low, close: OHLC prices
     """
-    if not CRYPTO_AVAILABLE:  # pragma: no cover
-        raise ImportError(
-            "cryptography library not installed. Install with: pip install cryptography"
-        )
-
-    if encrypted_path is None:
-        project_root = Path(__file__).parent.parent.parent
-        encrypted_path = str(project_root / "data" / "wrds_vix.enc")
-
-    if not Path(encrypted_path).exists():
-        raise FileNotFoundError(f"Encrypted VIX data not found: {encrypted_path}")
-
-    if key is None:
-        key = os.environ.get("WRDS_DATA_KEY")
-
-    if not key:
-        raise ValueError(
-            "Decryption key not provided. Either:\n"
-            "1. Set WRDS_DATA_KEY environment variable, or\n"
-            '2. Pass key parameter: load_encrypted_vix_data(key="...")'
-        )
-
-    cipher = Fernet(key.encode())
-    with open(encrypted_path, "rb") as f:
-        ciphertext = f.read()
-
-    try:
-        plaintext = cipher.decrypt(ciphertext)
-    except Exception as e:
-        raise ValueError(f"Decryption failed: {e}") from e
-
-    import gzip
-    import io
-
-    decompressed = gzip.decompress(plaintext)
-    data = pd.read_csv(io.BytesIO(decompressed))
-    data["date"] = pd.to_datetime(data["date"])
-
-    return data
+    return _load_encrypted(
+        "wrds_vix.enc",
+        ("date",),
+        encrypted_path,
+        key,
+        label="VIX data",
+        loader_name="load_encrypted_vix_data",
+    )
 
 
 def load_encrypted_treasury_data(
@@ -265,45 +406,14 @@ def load_encrypted_treasury_data(
         - observation_date: Date
         - DTB3: 3-month Treasury bill rate (annualized %)
     """
-    if not CRYPTO_AVAILABLE:  # pragma: no cover
-        raise ImportError(
-            "cryptography library not installed. Install with: pip install cryptography"
-        )
-
-    if encrypted_path is None:
-        project_root = Path(__file__).parent.parent.parent
-        encrypted_path = str(project_root / "data" / "fred_treasury.enc")
-
-    if not Path(encrypted_path).exists():
-        raise FileNotFoundError(f"Encrypted Treasury data not found: {encrypted_path}")
-
-    if key is None:
-        key = os.environ.get("WRDS_DATA_KEY")
-
-    if not key:
-        raise ValueError(
-            "Decryption key not provided. Either:\n"
-            "1. Set WRDS_DATA_KEY environment variable, or\n"
-            '2. Pass key parameter: load_encrypted_treasury_data(key="...")'
-        )
-
-    cipher = Fernet(key.encode())
-    with open(encrypted_path, "rb") as f:
-        ciphertext = f.read()
-
-    try:
-        plaintext = cipher.decrypt(ciphertext)
-    except Exception as e:
-        raise ValueError(f"Decryption failed: {e}") from e
-
-    import gzip
-    import io
-
-    decompressed = gzip.decompress(plaintext)
-    data = pd.read_csv(io.BytesIO(decompressed))
-    data["observation_date"] = pd.to_datetime(data["observation_date"])
-
-    return data
+    return _load_encrypted(
+        "fred_treasury.enc",
+        ("observation_date",),
+        encrypted_path,
+        key,
+        label="Treasury data",
+        loader_name="load_encrypted_treasury_data",
+    )
 
 
 def load_encrypted_spx_options_data(
@@ -330,48 +440,16 @@ def load_encrypted_spx_options_data(
         - best_bid, best_offer: Bid/ask prices
         - volume, open_interest: Trading metrics
     """
-    if not CRYPTO_AVAILABLE:  # pragma: no cover
-        raise ImportError(
-            "cryptography library not installed. Install with: pip install cryptography"
-        )
-
-    if encrypted_path is None:
-        project_root = Path(__file__).parent.parent.parent
-        encrypted_path = str(project_root / "data" / "wrds_spx_options.enc")
-
-    if not Path(encrypted_path).exists():
-        raise FileNotFoundError(
-            f"Encrypted SPX options data not found: {encrypted_path}"
-        )
-
-    if key is None:
-        key = os.environ.get("WRDS_DATA_KEY")
-
-    if not key:
-        raise ValueError(
-            "Decryption key not provided. Either:\n"
-            "1. Set WRDS_DATA_KEY environment variable, or\n"
-            '2. Pass key parameter: load_encrypted_spx_options_data(key="...")'
-        )
-
-    cipher = Fernet(key.encode())
-    with open(encrypted_path, "rb") as f:
-        ciphertext = f.read()
-
-    try:
-        plaintext = cipher.decrypt(ciphertext)
-    except Exception as e:
-        raise ValueError(f"Decryption failed: {e}") from e
-
-    import gzip
-    import io
-
-    decompressed = gzip.decompress(plaintext)
-    data = pd.read_csv(io.BytesIO(decompressed))
-    data["date"] = pd.to_datetime(data["date"])
-    data["exdate"] = pd.to_datetime(data["exdate"])
-
-    return data
+    return _load_encrypted(
+        "wrds_spx_options.enc",
+        ("date", "exdate"),
+        encrypted_path,
+        key,
+        label="SPX options data",
+        loader_name="load_encrypted_spx_options_data",
+        dtype=OPTION_DTYPES,
+        downcast_cols=OPTION_COUNT_COLUMNS,
+    )
 
 
 def get_wrds_data_info(data: pd.DataFrame) -> dict:
@@ -399,11 +477,14 @@ def get_wrds_data_info(data: pd.DataFrame) -> dict:
     >>> info['date_range']
     (Timestamp('1999-01-04'), Timestamp('2025-12-31'))
     """
-    unique_dates = data["date"].nunique()
+    date_stats = data["date"].agg(["min", "max", "nunique"])
+    strike_stats = data["strike_price"].agg(["min", "max"])
+    total_rows = len(data)
+    unique_dates = date_stats["nunique"]
     return {
-        "total_rows": len(data),
-        "date_range": (data["date"].min(), data["date"].max()),
+        "total_rows": total_rows,
+        "date_range": (date_stats["min"], date_stats["max"]),
         "unique_dates": unique_dates,
-        "avg_strikes_per_date": len(data) / unique_dates if unique_dates > 0 else 0.0,
-        "strike_range": (data["strike_price"].min(), data["strike_price"].max()),
+        "avg_strikes_per_date": total_rows / unique_dates if unique_dates > 0 else 0.0,
+        "strike_range": (strike_stats["min"], strike_stats["max"]),
     }
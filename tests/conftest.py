@@ -1,7 +1,28 @@
 """Configure pytest."""
 
+import importlib.util
 import os
 import sys
+from typing import Any, Iterator
+
+import pytest
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Probed once per session; finding the spec doesn't load the C extension
+HAS_GUROBI = importlib.util.find_spec("gurobipy") is not None
+
+
+@pytest.fixture(scope="session")
+def gurobi_env() -> Iterator[Any]:
+    """Silent Gurobi environment shared by every LP test in the session.
+
+    Under pytest-xdist each worker process gets its own environment.
+    """
+    gp = pytest.importorskip("gurobipy")
+    env = gp.Env(empty=True)
+    env.setParam("OutputFlag", 0)
+    env.start()
+    yield env
+    env.dispose()
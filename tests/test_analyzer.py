@@ -1,7 +1,10 @@
 """Tests for portfolio analyzer module."""
 
+from math import isclose
+
 import numpy as np
 import pandas as pd
+import pytest
 
 from options_hedge.analyzer import PortfolioAnalyzer
 
@@ -24,6 +27,7 @@ class TestPortfolioAnalyzer:
         assert analyzer.benchmark_col == "Benchmark"
         assert analyzer.rf == 0.0
         assert len(analyzer.returns) == 99  # One less due to pct_change
+        assert analyzer.returns.index[0] == data["Date"].iloc[1]
         assert "Strategy_A" in analyzer.returns.columns
         assert "Benchmark" in analyzer.returns.columns
 
@@ -70,7 +74,7 @@ class TestPortfolioAnalyzer:
         analyzer = PortfolioAnalyzer(data, benchmark_col="Benchmark")
         beta = analyzer.calculate_beta("Strategy")
 
-        assert abs(beta - 1.0) < 0.01
+        assert isclose(beta, 1.0, abs_tol=0.01)
 
     def test_capture_ratios(self) -> None:
         """Test upside and downside capture ratios."""
@@ -168,6 +172,24 @@ class TestPortfolioAnalyzer:
         # No downside volatility -> should be NaN or very high
         assert pd.isna(sortino) or sortino > 10
 
+    def test_sortino_constant_losses(self) -> None:
+        """Test identical negative returns give no downside deviation."""
+        dates = pd.date_range("2020-01-01", periods=100)
+        returns = np.where(np.arange(100) % 3 == 0, -0.01, 0.02)
+        returns[0] = 0.0
+
+        data = pd.DataFrame(
+            {
+                "Date": dates,
+                "Strategy": 100 * (1 + returns).cumprod(),
+                "Benchmark": np.linspace(100, 140, 100),
+            }
+        )
+
+        analyzer = PortfolioAnalyzer(data, benchmark_col="Benchmark")
+
+        assert pd.isna(analyzer.calculate_sortino("Strategy"))
+
     def test_calmar_ratio(self) -> None:
         """Test Calmar ratio calculation."""
         dates = pd.date_range("2020-01-01", periods=252)
@@ -190,6 +212,8 @@ class TestPortfolioAnalyzer:
         assert isinstance(calmar, float)
         assert not pd.isna(calmar)
         assert calmar > 0  # Positive return, should be positive
+        # 50% over one year against a 150 -> 120 (20%) drawdown
+        assert isclose(calmar, 2.5)
 
     def test_calmar_no_drawdown(self) -> None:
         """Test Calmar ratio with no drawdown."""
@@ -301,6 +325,7 @@ class TestPortfolioAnalyzer:
         # Should handle constant strategy (zero returns)
         beta = analyzer.calculate_beta("Strategy")
         assert isinstance(beta, float)
+        assert beta == 0.0
 
     def test_benchmark_beta_is_one(self) -> None:
         """Test that benchmark's beta vs itself is 1.0."""
@@ -316,7 +341,7 @@ class TestPortfolioAnalyzer:
         analyzer = PortfolioAnalyzer(data, benchmark_col="Benchmark")
         beta = analyzer.calculate_beta("Benchmark")
 
-        assert abs(beta - 1.0) < 0.01  # Should be very close to 1
+        assert isclose(beta, 1.0, abs_tol=0.01)  # Should be very close to 1
 
     def test_negative_returns_handling(self) -> None:
         """Test handling of strategies with negative total returns."""
@@ -341,3 +366,110 @@ class TestPortfolioAnalyzer:
         total_return = summary.loc["Strategy", "Total Return (%)"]
         assert total_return < 0  # type: ignore[operator]
         assert isinstance(summary.loc["Strategy", "Beta"], (int, float))
+
+    def test_summary_matches_individual_metrics(self) -> None:
+        """Test the fused summary pass agrees with the per-metric methods."""
+        dates = pd.date_range("2020-01-01", periods=252)
+        rng = np.random.default_rng(7)
+
+        data = pd.DataFrame(
+            {
+                "Date": dates,
+                "Strategy": 100 * (1 + rng.normal(0, 0.01, 252)).cumprod(),
+                "Benchmark": 100 * (1 + rng.normal(0, 0.01, 252)).cumprod(),
+            }
+        )
+
+        analyzer = PortfolioAnalyzer(data, benchmark_col="Benchmark")
+        row = analyzer.get_summary().loc["Strategy"]
+        up, down = analyzer.calculate_capture_ratios("Strategy")
+
+        assert row["Beta"] == round(analyzer.calculate_beta("Strategy"), 2)
+        assert row["Up Capture (%)"] == round(up, 1)
+        assert row["Down Capture (%)"] == round(down, 1)
+        assert row["Sortino Ratio"] == round(analyzer.calculate_sortino("Strategy"), 2)
+        assert row["Calmar Ratio"] == round(analyzer.calculate_calmar("Strategy"), 2)
+
+    def test_float32_internal_arrays(self) -> None:
+        """Test float32 metrics track float64 while returns stay float64."""
+        dates = pd.date_range("2020-01-01", periods=252)
+        rng = np.random.default_rng(11)
+
+        data = pd.DataFrame(
+            {
+                "Date": dates,
+                "Strategy": 100 * (1 + rng.normal(0, 0.01, 252)).cumprod(),
+                "Benchmark": 100 * (1 + rng.normal(0, 0.01, 252)).cumprod(),
+            }
+        )
+
+        exact = PortfolioAnalyzer(data, benchmark_col="Benchmark")
+        fast = PortfolioAnalyzer(data, benchmark_col="Benchmark", dtype=np.float32)
+
+        assert fast.returns["Strategy"].dtype == np.float64
+        for metric in ("calculate_beta", "calculate_sortino", "calculate_calmar"):
+            assert isclose(
+                getattr(fast, metric)("Strategy"),
+                getattr(exact, metric)("Strategy"),
+                rel_tol=1e-4,
+            )
+        for fast_ratio, exact_ratio in zip(
+            fast.calculate_capture_ratios("Strategy"),
+            exact.calculate_capture_ratios("Strategy"),
+        ):
+            assert isclose(fast_ratio, exact_ratio, rel_tol=1e-4)
+
+    def test_summary_cached_per_risk_free_rate(self) -> None:
+        """Test repeat summaries are cached copies keyed on the risk-free rate."""
+        dates = pd.date_range("2020-01-01", periods=252)
+        rng = np.random.default_rng(3)
+
+        data = pd.DataFrame(
+            {
+                "Date": dates,
+                "Strategy": 100 * (1 + rng.normal(0.001, 0.01, 252)).cumprod(),
+                "Benchmark": 100 * (1 + rng.normal(0, 0.01, 252)).cumprod(),
+            }
+        )
+
+        analyzer = PortfolioAnalyzer(data, benchmark_col="Benchmark")
+        first = analyzer.get_summary()
+        first.loc["Strategy", "Beta"] = 99.0  # Must not poison the cache
+
+        second = analyzer.get_summary()
+        assert second.loc["Strategy", "Beta"] != 99.0
+        assert second is not first
+
+        analyzer.rf = 0.05
+        with_rf = analyzer.get_summary()
+        sortino = second.loc["Strategy", "Sortino Ratio"]
+        assert with_rf.loc["Strategy", "Sortino Ratio"] < sortino  # type: ignore[operator]
+
+    def test_missing_values_carry_forward(self) -> None:
+        """Test a gap keeps the last value, so the move across it survives."""
+        data = pd.DataFrame(
+            {
+                "Date": pd.date_range("2020-01-01", periods=5),
+                "Strategy": [100.0, np.nan, 110.0, 121.0, 115.0],
+                "Benchmark": [100.0, 101.0, 99.0, 102.0, 103.0],
+            }
+        )
+
+        analyzer = PortfolioAnalyzer(data, benchmark_col="Benchmark")
+
+        expected = data.set_index("Date").ffill().pct_change().dropna()
+        pd.testing.assert_frame_equal(analyzer.returns, expected)
+        assert not np.isnan(analyzer.calculate_calmar("Strategy"))
+
+    def test_leading_missing_values_raise(self) -> None:
+        """Test a column that starts with missing values is rejected."""
+        data = pd.DataFrame(
+            {
+                "Date": pd.date_range("2020-01-01", periods=3),
+                "Strategy": [np.nan, 100.0, 101.0],
+                "Benchmark": [100.0, 101.0, 99.0],
+            }
+        )
+
+        with pytest.raises(ValueError, match="Strategy"):
+            PortfolioAnalyzer(data, benchmark_col="Benchmark")
@@ -1,16 +1,17 @@
 """Unit tests for Market data module with mocked yfinance."""
 
-from unittest.mock import patch
+from typing import Iterator
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 
-from options_hedge.market import Market
+from options_hedge.market import Market, _daily_returns
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_yf_data() -> pd.DataFrame:
-    """Create mock yfinance DataFrame."""
+    """Create mock yfinance DataFrame once; tests only see copies of it."""
     dates = pd.date_range("2024-01-01", periods=5, freq="D")
     return pd.DataFrame(
         {
@@ -24,128 +25,112 @@ def mock_yf_data() -> pd.DataFrame:
     )
 
 
+@pytest.fixture
+def mock_download(mock_yf_data: pd.DataFrame) -> Iterator[MagicMock]:
+    """Patch yf.download to return a fresh copy of the mock data."""
+    with patch("options_hedge.market.yf.download") as mock:
+        mock.side_effect = lambda *args, **kwargs: mock_yf_data.copy()
+        yield mock
+
+
 def test_market_initialization_with_mock(
-    mock_yf_data: pd.DataFrame,
+    mock_download: MagicMock,
 ) -> None:
     """Test Market initialization with mocked yfinance download."""
-    with patch("options_hedge.market.yf.download") as mock_download:
-        mock_download.return_value = mock_yf_data.copy()
+    market = Market(ticker="SPY", start="2024-01-01", end="2024-01-05")
 
-        market = Market(ticker="SPY", start="2024-01-01", end="2024-01-05")
-
-        # Verify yfinance was called with correct parameters
-        mock_download.assert_called_once_with(
-            "SPY", start="2024-01-01", end="2024-01-05", auto_adjust=False
-        )
+    # Verify yfinance was called with correct parameters
+    mock_download.assert_called_once_with(
+        "SPY", start="2024-01-01", end="2024-01-05", auto_adjust=False
+    )
 
-        # Verify Returns column was added
-        assert "Returns" in market.data.columns  # type: ignore[attr-defined]
-        assert len(market.data) == 5  # type: ignore[arg-type]
+    # Verify Returns column was added
+    assert "Returns" in market.data.columns  # type: ignore[attr-defined]
+    assert len(market.data) == 5  # type: ignore[arg-type]
 
-        # First return should be 0.0 (no previous day)
-        first_return = market.data["Returns"].iloc[0]  # type: ignore[attr-defined]
-        assert first_return == 0.0
+    # First return should be 0.0 (no previous day)
+    first_return = market.data["Returns"].iloc[0]  # type: ignore[attr-defined]
+    assert first_return == 0.0
 
 
 def test_market_returns_calculation(
-    mock_yf_data: pd.DataFrame,
+    mock_download: MagicMock,
 ) -> None:
     """Test that returns are calculated correctly."""
-    with patch("options_hedge.market.yf.download") as mock_download:
-        mock_download.return_value = mock_yf_data.copy()
-
-        market = Market()
+    market = Market()
 
-        # Calculate expected returns
-        expected_return_day2 = (102 - 101) / 101
-        actual = market.data["Returns"].iloc[1]  # type: ignore[attr-defined]
+    # Calculate expected returns
+    expected_return_day2 = (102 - 101) / 101
+    actual = market.data["Returns"].iloc[1]  # type: ignore[attr-defined]
 
-        assert (
-            pytest.approx(actual, abs=1e-6)  # type: ignore[arg-type]
-            == expected_return_day2
-        )
+    assert (
+        pytest.approx(actual, abs=1e-6)  # type: ignore[arg-type]
+        == expected_return_day2
+    )
 
 
-def test_get_price(mock_yf_data: pd.DataFrame) -> None:
+def test_get_price(mock_download: MagicMock) -> None:
     """Test get_price method returns correct value."""
-    with patch("options_hedge.market.yf.download") as mock_download:
-        mock_download.return_value = mock_yf_data.copy()
+    market = Market()
+    dates = list(market.data.index)  # type: ignore[attr-defined,arg-type]
 
-        market = Market()
-        dates = list(market.data.index)  # type: ignore[attr-defined,arg-type]
+    price = market.get_price(dates[0])  # type: ignore[arg-type]
+    assert price == 101.0
 
-        price = market.get_price(dates[0])  # type: ignore[arg-type]
-        assert price == 101.0
 
-
-def test_get_returns(mock_yf_data: pd.DataFrame) -> None:
+def test_get_returns(mock_download: MagicMock) -> None:
     """Test get_returns method returns Series."""
-    with patch("options_hedge.market.yf.download") as mock_download:
-        mock_download.return_value = mock_yf_data.copy()
-
-        market = Market()
-        returns = market.get_returns()
+    market = Market()
+    returns = market.get_returns()
 
-        assert isinstance(returns, pd.Series)
-        assert len(returns) == 5
-        assert returns.iloc[0] == 0.0
+    assert isinstance(returns, pd.Series)
+    assert len(returns) == 5
+    assert returns.iloc[0] == 0.0
 
 
 def test_market_with_default_parameters(
-    mock_yf_data: pd.DataFrame,
+    mock_download: MagicMock,
 ) -> None:
     """Test Market uses default ticker and dates."""
-    with patch("options_hedge.market.yf.download") as mock_download:
-        mock_download.return_value = mock_yf_data.copy()
+    _ = Market()
 
-        _ = Market()
+    # Should use defaults from constants
+    mock_download.assert_called_once()
+    call_kwargs = mock_download.call_args[1]  # type: ignore[index]
+    assert call_kwargs["auto_adjust"] is False
 
-        # Should use defaults from constants
-        mock_download.assert_called_once()
-        call_kwargs = mock_download.call_args[1]  # type: ignore[index]
-        assert call_kwargs["auto_adjust"] is False
 
-
-def test_market_get_price_missing_date(mock_yf_data: pd.DataFrame) -> None:
+def test_market_get_price_missing_date(mock_download: MagicMock) -> None:
     """Test that get_price raises KeyError for dates not in index."""
-    with patch("options_hedge.market.yf.download") as mock_download:
-        mock_download.return_value = mock_yf_data.copy()
-
-        market = Market()
-        missing_date = pd.Timestamp("2025-01-10")  # Not in 5-day range
-        with pytest.raises(KeyError):
-            market.get_price(missing_date)
+    market = Market()
+    missing_date = pd.Timestamp("2025-01-10")  # Not in 5-day range
+    with pytest.raises(KeyError):
+        market.get_price(missing_date)
 
 
 def test_market_returns_first_day_is_zero(
-    mock_yf_data: pd.DataFrame,
+    mock_download: MagicMock,
 ) -> None:
     """Test that first day's return is filled with 0.0."""
-    with patch("options_hedge.market.yf.download") as mock_download:
-        mock_download.return_value = mock_yf_data.copy()
-
-        market = Market()
-        returns = market.get_returns()
-        # First return should be 0.0 (filled)
-        assert returns.iloc[0] == 0.0
+    market = Market()
+    returns = market.get_returns()
+    # First return should be 0.0 (filled)
+    assert returns.iloc[0] == 0.0
 
 
-def test_market_returns_pct_change(mock_yf_data: pd.DataFrame) -> None:
+def test_market_returns_pct_change(mock_download: MagicMock) -> None:
     """Test daily returns calculation is correct."""
-    with patch("options_hedge.market.yf.download") as mock_download:
-        mock_download.return_value = mock_yf_data.copy()
-
-        market = Market()
-        # Second day: (102 - 101) / 101 ≈ 0.00990099
-        assert pytest.approx(
-            market.data["Returns"].iloc[1],  # type: ignore[attr-defined]
-            rel=1e-4,
-        ) == pytest.approx(0.00990099, rel=1e-4)
-        # Third day: (100 - 102) / 102 ≈ -0.0196078
-        assert pytest.approx(
-            market.data["Returns"].iloc[2],  # type: ignore[attr-defined]
-            rel=1e-4,
-        ) == pytest.approx(-0.0196078, rel=1e-4)
+    market = Market()
+    # Second day: (102 - 101) / 101 ≈ 0.00990099
+    assert pytest.approx(
+        market.data["Returns"].iloc[1],  # type: ignore[attr-defined]
+        rel=1e-4,
+    ) == pytest.approx(0.00990099, rel=1e-4)
+    # Third day: (100 - 102) / 102 ≈ -0.0196078
+    assert pytest.approx(
+        market.data["Returns"].iloc[2],  # type: ignore[attr-defined]
+        rel=1e-4,
+    ) == pytest.approx(-0.0196078, rel=1e-4)
 
 
 def test_market_has_pricer_with_wrds_data() -> None:
@@ -176,3 +161,36 @@ def test_market_has_pricer_with_wrds_data() -> None:
         )
         # Strikes should be a list (might be empty if no data for this date/expiry)
         assert isinstance(strikes, list)
+
+
+def test_daily_returns_match_pct_change() -> None:
+    """NumPy returns equal pct_change().fillna(0.0), per column for frames."""
+    dates = pd.date_range("2024-01-01", periods=6, freq="D")
+    close = pd.DataFrame(
+        {
+            ("Close", "SPY"): [101.0, 102.0, 100.0, 101.0, 103.0, 99.5],
+            ("Close", "QQQ"): [50.0, 49.0, 49.5, 52.0, 51.0, 53.0],
+        },
+        index=dates,
+    )["Close"]
+
+    expected = close.pct_change().fillna(0.0)
+    pd.testing.assert_frame_equal(_daily_returns(close), expected)
+    pd.testing.assert_series_equal(_daily_returns(close["SPY"]), expected["SPY"])
+
+
+def test_daily_returns_carry_price_across_gaps() -> None:
+    """A missing close keeps the last price, so the move across it survives."""
+    dates = pd.date_range("2024-01-01", periods=5, freq="D")
+    close = pd.DataFrame(
+        {
+            "SPY": [100.0, float("nan"), 110.0, 121.0, 120.0],
+            "QQQ": [float("nan"), 50.0, 49.0, float("nan"), 53.0],
+        },
+        index=dates,
+    )
+
+    returns = _daily_returns(close)
+    expected = close.ffill().pct_change().fillna(0.0)
+    pd.testing.assert_frame_equal(returns, expected)
+    assert (1.0 + returns["SPY"]).prod() == pytest.approx(1.20)
@@ -7,27 +7,47 @@ import pytest
 
 from options_hedge.option import Option
 
+# Fixed valuation date so results don't depend on the wall clock
+TODAY = datetime(2024, 1, 1)
+
 
 def test_put_payoff_and_value_before_expiry() -> None:
-    expiry = datetime.now() + timedelta(days=30)
+    expiry = TODAY + timedelta(days=30)
     opt = Option(strike=100.0, premium=2.5, expiry=expiry, quantity=2)
     # Intrinsic payoff
     assert opt.payoff(90.0) == (100.0 - 90.0) * 2
     assert opt.payoff(110.0) == 0.0
     # Value equals intrinsic when before expiry
-    current = pd.Timestamp(datetime.now())
+    current = pd.Timestamp(TODAY)
     assert opt.value(90.0, current) == (100.0 - 90.0) * 2
     assert opt.value(110.0, current) == 0.0
 
 
 def test_put_value_after_expiry_is_zero() -> None:
-    expiry = datetime.now() + timedelta(days=1)
+    expiry = TODAY + timedelta(days=1)
     opt = Option(strike=100.0, premium=2.5, expiry=expiry, quantity=1)
     after = pd.Timestamp(expiry + timedelta(days=1))
     assert opt.value(50.0, after) == 0.0
 
 
 def test_total_cost() -> None:
-    expiry = datetime.now() + timedelta(days=10)
+    expiry = TODAY + timedelta(days=10)
     opt = Option(strike=50.0, premium=3.0, expiry=expiry, quantity=5)
     assert pytest.approx(opt.total_cost()) == 15.0
+
+
+def test_expiry_timestamp_converted_once() -> None:
+    expiry = datetime(2024, 12, 31)
+    opt = Option(strike=100.0, premium=2.5, expiry=expiry)
+    assert opt.expiry_ts == pd.Timestamp(expiry)
+    # Derived field does not affect equality
+    assert opt == Option(strike=100.0, premium=2.5, expiry=expiry)
+    assert opt.value(90.0, pd.Timestamp("2024-12-30")) == 10.0
+    assert opt.value(90.0, pd.Timestamp("2024-12-31")) == 0.0
+
+
+def test_shared_expiry_reuses_timestamp() -> None:
+    expiry = datetime(2025, 3, 21)
+    first = Option(strike=100.0, premium=2.5, expiry=expiry)
+    second = Option(strike=90.0, premium=1.0, expiry=datetime(2025, 3, 21))
+    assert first.expiry_ts is second.expiry_ts
@@ -7,81 +7,60 @@ import pytest
 
 from options_hedge.portfolio import Portfolio
 
+TRADE_DATE = datetime(2023, 1, 1)
+EXPIRY = TRADE_DATE + timedelta(days=30)
+LATER_EXPIRY = TRADE_DATE + timedelta(days=60)
 
-def test_option_exercise_at_expiry() -> None:
-    """Verify that ITM options are exercised and payoff realized in cash."""
-    # Setup
-    portfolio = Portfolio(initial_value=1_000_000, beta=1.0)
-    initial_cash = portfolio.cash
-
-    # Buy a put option
-    strike = 4000.0
-    premium = 100.0
-    current_date = datetime(2023, 1, 1)
-    expiry = current_date + timedelta(days=30)
-
-    portfolio.buy_put(strike=strike, premium=premium, expiry=expiry, quantity=1)
+# Settlement dates as Timestamps, built once for all tests
+TRADE_TS = pd.Timestamp(TRADE_DATE)
+EXPIRY_TS = pd.Timestamp(EXPIRY)
+LATER_EXPIRY_TS = pd.Timestamp(LATER_EXPIRY)
 
-    # Verify option purchased
-    assert len(portfolio.options) == 1
-    cash_after_purchase = portfolio.cash
-    assert cash_after_purchase < initial_cash  # Paid premium + transaction cost
 
-    # Market crashes - put is now ITM
-    crash_price = 3500.0  # Put is $500 ITM
-    expiry_date = pd.Timestamp(expiry)
+@pytest.fixture
+def portfolio() -> Portfolio:
+    """Fresh $1M portfolio; tests mutate it, so it is not shared."""
+    return Portfolio(initial_value=1_000_000, beta=1.0)
 
-    # Exercise expired options
-    portfolio.exercise_expired_options(crash_price, expiry_date)
 
-    # Verify option exercised
-    assert len(portfolio.options) == 0, "Option should be removed after expiry"
+EXPIRY_CASES = [
+    pytest.param(3500.0, 500.0, id="itm_exercised"),
+    pytest.param(4000.0, 0.0, id="atm_worthless"),
+    pytest.param(4500.0, 0.0, id="otm_worthless"),
+]
+"""(price at expiry, expected payoff) for a 4000-strike put."""
 
-    expected_payoff = strike - crash_price  # $500
-    expected_cash = cash_after_purchase + expected_payoff
 
-    assert portfolio.cash == pytest.approx(expected_cash), (
-        f"Cash should increase by payoff: "
-        f"got {portfolio.cash}, expected {expected_cash}"
-    )
-
-
-def test_option_expires_worthless() -> None:
-    """Verify that OTM options expire worthless without cash impact."""
-    portfolio = Portfolio(initial_value=1_000_000, beta=1.0)
-
-    strike = 4000.0
-    premium = 100.0
-    current_date = datetime(2023, 1, 1)
-    expiry = current_date + timedelta(days=30)
+@pytest.mark.parametrize("price_at_expiry,expected_payoff", EXPIRY_CASES)
+def test_option_settles_at_expiry(
+    portfolio: Portfolio,
+    price_at_expiry: float,
+    expected_payoff: float,
+) -> None:
+    """Verify expired puts are removed and only ITM payoff is realized in cash."""
+    initial_cash = portfolio.cash
+    portfolio.buy_put(strike=4000.0, premium=100.0, expiry=EXPIRY, quantity=1)
 
-    portfolio.buy_put(strike=strike, premium=premium, expiry=expiry, quantity=1)
+    # Verify option purchased
+    assert len(portfolio.options) == 1
     cash_after_purchase = portfolio.cash
+    assert cash_after_purchase < initial_cash  # Paid premium + transaction cost
 
-    # Market rises - put is OTM
-    high_price = 4500.0
-    expiry_date = pd.Timestamp(expiry)
-
-    portfolio.exercise_expired_options(high_price, expiry_date)
+    portfolio.exercise_expired_options(price_at_expiry, EXPIRY_TS)
 
-    # Verify option removed but no payoff
-    assert len(portfolio.options) == 0
-    assert portfolio.cash == cash_after_purchase, "OTM option should not add cash"
+    assert len(portfolio.options) == 0, "Option should be removed after expiry"
+    assert portfolio.cash == pytest.approx(cash_after_purchase + expected_payoff)
 
 
-def test_option_not_exercised_before_expiry() -> None:
+def test_option_not_exercised_before_expiry(portfolio: Portfolio) -> None:
     """Verify that options are not exercised before expiry date."""
-    portfolio = Portfolio(initial_value=1_000_000, beta=1.0)
-
     strike = 4000.0
     premium = 100.0
-    current_date = datetime(2023, 1, 1)
-    expiry = current_date + timedelta(days=30)
 
-    portfolio.buy_put(strike=strike, premium=premium, expiry=expiry, quantity=1)
+    portfolio.buy_put(strike=strike, premium=premium, expiry=EXPIRY, quantity=1)
 
     # One day before expiry
-    before_expiry = pd.Timestamp(expiry - timedelta(days=1))
+    before_expiry = EXPIRY_TS - pd.Timedelta(days=1)
     crash_price = 3500.0
 
     portfolio.exercise_expired_options(crash_price, before_expiry)
@@ -90,38 +69,59 @@ def test_option_not_exercised_before_expiry() -> None:
     assert len(portfolio.options) == 1, "Option should not be exercised before expiry"
 
 
-def test_multiple_options_exercise() -> None:
-    """Verify that multiple options exercise correctly."""
-    portfolio = Portfolio(initial_value=1_000_000, beta=1.0)
-
-    current_date = datetime(2023, 1, 1)
-    expiry1 = current_date + timedelta(days=30)
-    expiry2 = current_date + timedelta(days=60)
-
-    # Buy two options with different expiries
-    portfolio.buy_put(strike=4000.0, premium=100.0, expiry=expiry1, quantity=1)
-    portfolio.buy_put(strike=3800.0, premium=80.0, expiry=expiry2, quantity=1)
-
+@pytest.fixture
+def laddered_portfolio(portfolio: Portfolio) -> Portfolio:
+    """Portfolio holding a 4000 put at the 30d expiry and a 3800 put at 60d."""
+    portfolio.buy_put(strike=4000.0, premium=100.0, expiry=EXPIRY, quantity=1)
+    portfolio.buy_put(strike=3800.0, premium=80.0, expiry=LATER_EXPIRY, quantity=1)
+    return portfolio
+
+
+@pytest.mark.parametrize(
+    "crash_price,first_payoff,second_payoff",
+    [
+        pytest.param(3500.0, 500.0, 300.0, id="both_itm"),
+        pytest.param(3900.0, 100.0, 0.0, id="second_otm"),
+    ],
+)
+def test_multiple_options_exercise(
+    laddered_portfolio: Portfolio,
+    crash_price: float,
+    first_payoff: float,
+    second_payoff: float,
+) -> None:
+    """Verify that multiple options exercise correctly at their own expiries."""
+    portfolio = laddered_portfolio
     assert len(portfolio.options) == 2
     cash_after_purchase = portfolio.cash
 
     # First expiry date - only first option should exercise
-    expiry1_ts = pd.Timestamp(expiry1)
-    crash_price = 3500.0
-
-    portfolio.exercise_expired_options(crash_price, expiry1_ts)
+    portfolio.exercise_expired_options(crash_price, EXPIRY_TS)
 
     assert len(portfolio.options) == 1, "Only first option should be removed"
-
-    # First option payoff: 4000 - 3500 = 500
-    expected_cash = cash_after_purchase + (4000.0 - crash_price)
+    expected_cash = cash_after_purchase + first_payoff
     assert portfolio.cash == pytest.approx(expected_cash)
 
-    # Second expiry - remaining option exercises
-    expiry2_ts = pd.Timestamp(expiry2)
-    portfolio.exercise_expired_options(crash_price, expiry2_ts)
+    # Second expiry - remaining option settles
+    portfolio.exercise_expired_options(crash_price, LATER_EXPIRY_TS)
 
     assert len(portfolio.options) == 0
-    # Second option payoff: 3800 - 3500 = 300
-    expected_cash += 3800.0 - crash_price
+    expected_cash += second_payoff
     assert portfolio.cash == pytest.approx(expected_cash)
+
+
+def test_early_exercise_is_disabled(portfolio: Portfolio) -> None:
+    """Verify early exercise is a no-op that never evaluates the rule."""
+    portfolio.buy_put(strike=4000.0, premium=100.0, expiry=EXPIRY, quantity=1)
+    cash_after_purchase = portfolio.cash
+
+    def always_exercise(*args: object, **kwargs: object) -> bool:
+        raise AssertionError("exercise rule should not be evaluated")
+
+    num_exercised = portfolio.check_early_exercise(
+        3000.0, TRADE_TS, always_exercise, threshold=0.5
+    )
+
+    assert num_exercised == 0
+    assert len(portfolio.options) == 1
+    assert portfolio.cash == cash_after_purchase
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import NoReturn
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -102,6 +103,34 @@ class TestOptionPricerSynthetic:
 
         assert high_vix > low_vix
 
+    def test_batch_premiums_match_scalar(self) -> None:
+        """Test the vectorized path agrees with scalar pricing per row."""
+        pricer = OptionPricer()
+        date = pd.Timestamp("2020-03-01")
+        expiry = pd.Timestamp("2020-06-19")
+        strikes = np.array([2000.0, 3500.0, 4000.0, 4500.0])
+        vixes = np.array([15.0, 30.0, 20.0, 60.0])
+
+        premiums = pricer.get_put_premiums(strikes, 4000.0, date, expiry, vixes)
+
+        expected = [
+            pricer.get_put_premium(k, 4000.0, date, expiry, v)
+            for k, v in zip(strikes, vixes)
+        ]
+        np.testing.assert_allclose(premiums, expected, rtol=1e-12)
+
+    def test_expired_option_gets_floor_premium(self) -> None:
+        """Test an expiry before the trade date prices at the floor."""
+        pricer = OptionPricer()
+        date = pd.Timestamp("2020-03-01")
+        expiry = pd.Timestamp("2020-02-01")
+
+        premium = pricer.get_put_premium(3500.0, 4000.0, date, expiry)
+        premiums = pricer.get_put_premiums([3500.0], 4000.0, date, expiry)
+
+        assert premium == 0.001
+        np.testing.assert_array_equal(premiums, [0.001])
+
 
 class TestOptionPricerWRDS:
     """Tests for WRDS data pricing mode."""
@@ -211,6 +240,38 @@ class TestOptionPricerWRDS:
         # Should use synthetic pricing
         assert premium > 0
 
+    def test_wrds_batch_premiums_match_scalar(
+        self, sample_wrds_data: pd.DataFrame
+    ) -> None:
+        """Test batch lookups use WRDS matches and price the rest synthetically."""
+        pricer = OptionPricer(use_wrds=True, wrds_data=sample_wrds_data)
+        dates = pd.to_datetime(["2020-03-01", "2020-03-02", "2021-01-01"])
+        expiries = pd.to_datetime(["2020-06-19", "2020-06-19", "2021-03-19"])
+
+        premiums = pricer.get_put_premiums(3500.0, 4000.0, dates, expiries, 30.0)
+
+        expected = [
+            pricer.get_put_premium(3500.0, 4000.0, d, e, 30.0)
+            for d, e in zip(dates, expiries)
+        ]
+        np.testing.assert_allclose(premiums, expected, rtol=1e-12)
+        assert premiums[0] == 0.0125  # WRDS mid-price 50 / 4000
+        assert premiums[1] == 0.013  # WRDS mid-price 52 / 4000
+
+    def test_wrds_batch_picks_closest_strike_per_date(
+        self, sample_wrds_data: pd.DataFrame
+    ) -> None:
+        """Test batch matching picks the closest strike for each element."""
+        pricer = OptionPricer(use_wrds=True, wrds_data=sample_wrds_data)
+        dates = pd.to_datetime(["2020-03-01", "2020-03-02", "2020-03-01"])
+
+        premiums = pricer.get_put_premiums(
+            [3590.0, 3590.0, 3510.0], 4000.0, dates, pd.Timestamp("2020-06-19"), 30.0
+        )
+
+        # 3600 on 2020-03-01, only 3500 on 2020-03-02, then 3500 again
+        np.testing.assert_allclose(premiums, [0.015, 0.013, 0.0125])
+
     def test_wrds_no_match_outside_tolerance(
         self, sample_wrds_data: pd.DataFrame
     ) -> None:
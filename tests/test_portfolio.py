@@ -3,9 +3,13 @@
 from datetime import datetime, timedelta
 
 import pandas as pd
+import pytest
 
 from options_hedge.portfolio import Portfolio
 
+# Fixed trade date so results don't depend on the wall clock
+TODAY = pd.Timestamp("2024-01-01")
+
 
 def test_portfolio_buy_put_updates_cash_and_options() -> None:
     p = Portfolio(initial_value=1000.0, beta=1.0)
@@ -38,3 +42,31 @@ def test_record_history() -> None:
     assert len(p.history) == 1
     assert p.history[0]["Date"] == now
     assert p.history[0]["Value"] == 505.0
+
+
+def test_buy_put_quantity_books_one_position() -> None:
+    """Buying N contracts at once costs the same as N single buys."""
+    expiry = TODAY + timedelta(days=30)
+    batched = Portfolio(initial_value=1000.0, beta=1.0)
+    batched.buy_put(strike=90.0, premium=10.0, expiry=expiry, quantity=10)
+
+    singles = Portfolio(initial_value=1000.0, beta=1.0)
+    for _ in range(10):
+        singles.buy_put(strike=90.0, premium=10.0, expiry=expiry, quantity=1)
+
+    assert len(batched.options) == 1
+    assert batched.options[0].quantity == 10
+    assert batched.cash == pytest.approx(singles.cash)
+    assert batched.total_transaction_costs == pytest.approx(
+        singles.total_transaction_costs
+    )
+
+
+def test_buy_put_uses_configured_bid_ask_spread() -> None:
+    """The option spread is a Portfolio setting, not a fixed 5% markup."""
+    expiry = TODAY + timedelta(days=30)
+    p = Portfolio(initial_value=1000.0, beta=1.0, option_bid_ask_spread=0.10)
+    p.buy_put(strike=90.0, premium=10.0, expiry=expiry, quantity=2)
+    # base cost = 10.0 * 2 = 20.0, spread = 20.0 * 0.10 = 2.0
+    assert p.cash == pytest.approx(-22.0)
+    assert p.total_transaction_costs == pytest.approx(2.0)
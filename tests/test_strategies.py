@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 
 import pandas as pd
 import pytest
+from conftest import HAS_GUROBI
 
 from options_hedge.portfolio import Portfolio
 from options_hedge.strategies import (
@@ -13,15 +14,6 @@ from options_hedge.strategies import (
     vix_ladder_strategy,
 )
 
-# Skip LP tests if gurobipy isn't available
-try:
-    import gurobipy  # type: ignore
-
-    GUROBI_AVAILABLE = True
-    _ = gurobipy.Model  # Use the import to satisfy linter
-except (ImportError, ModuleNotFoundError):
-    GUROBI_AVAILABLE = False
-
 
 class FakeMarket:
     def __init__(self, dates: pd.DatetimeIndex) -> None:
@@ -61,6 +53,48 @@ def test_quarterly_strategy_buys_puts_on_schedule() -> None:
     assert len(p.options) == 2
 
 
+def test_quarterly_strategy_caches_vix_lookup() -> None:
+    """get_vix is resolved once per run; markets without it use the default."""
+    dates = pd.date_range("2025-01-01", periods=100, freq="D")
+    mkt = FakeMarket(dates)
+    params = {"hedge_interval": 90, "expiry_days": 90}
+    quarterly_protective_put_strategy(
+        Portfolio(initial_value=1000.0, beta=1.0),
+        100.0,
+        datetime(2025, 1, 1),
+        params,
+        mkt,
+    )
+    assert params["_get_vix"] == mkt.get_vix
+
+    class NoVixMarket:
+        data = mkt.data
+
+    params_no_vix = {"hedge_interval": 90, "expiry_days": 90}
+    p = Portfolio(initial_value=1000.0, beta=1.0)
+    quarterly_protective_put_strategy(
+        p,
+        100.0,
+        datetime(2025, 1, 1),
+        params_no_vix,
+        NoVixMarket(),  # type: ignore[arg-type]
+    )
+    assert params_no_vix["_get_vix"] is None
+    assert len(p.options) == 1
+
+    # Reusing params with another market resolves that market's get_vix
+    other = FakeMarket(dates)
+    quarterly_protective_put_strategy(
+        Portfolio(initial_value=1000.0, beta=1.0),
+        100.0,
+        datetime(2025, 4, 5),  # past the hedge interval, so it hedges again
+        params,
+        other,
+    )
+    assert params["_get_vix"] == other.get_vix
+    assert params["_vix_market"] is other
+
+
 def test_conditional_strategy_triggers_on_drop_or_vol_spike() -> None:
     p = Portfolio(initial_value=1000.0, beta=1.0)
     dates = pd.date_range("2025-01-01", periods=60, freq="D")
@@ -85,7 +119,7 @@ def test_conditional_strategy_triggers_on_drop_or_vol_spike() -> None:
     assert len(p.options) == 1
 
 
-@pytest.mark.skipif(not GUROBI_AVAILABLE, reason="gurobipy not installed")
+@pytest.mark.skipif(not HAS_GUROBI, reason="gurobipy not installed")
 def test_fixed_floor_lp_strategy_basic_execution() -> None:
     """Test fixed floor LP strategy executes and buys options."""
     p = Portfolio(initial_value=100_000.0, beta=1.0)
@@ -112,7 +146,7 @@ def test_fixed_floor_lp_strategy_basic_execution() -> None:
     assert result["total_cost"] >= 0
 
 
-@pytest.mark.skipif(not GUROBI_AVAILABLE, reason="gurobipy not installed")
+@pytest.mark.skipif(not HAS_GUROBI, reason="gurobipy not installed")
 def test_fixed_floor_lp_strategy_skips_within_interval() -> None:
     """Test fixed floor LP skips hedging within interval."""
     p = Portfolio(initial_value=100_000.0, beta=1.0)
@@ -148,7 +182,7 @@ def test_fixed_floor_lp_strategy_skips_within_interval() -> None:
         assert result2["total_cost"] == 0.0
 
 
-@pytest.mark.skipif(not GUROBI_AVAILABLE, reason="gurobipy not installed")
+@pytest.mark.skipif(not HAS_GUROBI, reason="gurobipy not installed")
 def test_fixed_floor_lp_strategy_cash_management() -> None:
     """Test fixed floor LP handles cash rebalancing."""
     p = Portfolio(initial_value=100_000.0, beta=1.0)
@@ -179,7 +213,7 @@ def test_fixed_floor_lp_strategy_cash_management() -> None:
         assert p.equity_value < initial_equity  # Sold some equity
 
 
-@pytest.mark.skipif(not GUROBI_AVAILABLE, reason="gurobipy not installed")
+@pytest.mark.skipif(not HAS_GUROBI, reason="gurobipy not installed")
 def test_fixed_floor_lp_strategy_with_verbose() -> None:
     """Test fixed floor LP verbose output doesn't crash."""
     p = Portfolio(initial_value=100_000.0, beta=1.0)
@@ -203,7 +237,7 @@ def test_fixed_floor_lp_strategy_with_verbose() -> None:
     assert result is not None
 
 
-@pytest.mark.skipif(not GUROBI_AVAILABLE, reason="gurobipy not installed")
+@pytest.mark.skipif(not HAS_GUROBI, reason="gurobipy not installed")
 def test_vix_ladder_strategy_basic_execution() -> None:
     """Test VIX ladder strategy executes."""
     p = Portfolio(initial_value=100_000.0, beta=1.0)
@@ -231,7 +265,7 @@ def test_vix_ladder_strategy_basic_execution() -> None:
     assert result >= 0
 
 
-@pytest.mark.skipif(not GUROBI_AVAILABLE, reason="gurobipy not installed")
+@pytest.mark.skipif(not HAS_GUROBI, reason="gurobipy not installed")
 def test_vix_ladder_strategy_skips_within_interval() -> None:
     """Test VIX ladder strategy executes multiple times (no interval skip)."""
     p = Portfolio(initial_value=100_000.0, beta=1.0)
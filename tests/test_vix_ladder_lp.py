@@ -365,3 +365,28 @@ class TestSolveVixLadderLP:
         )
 
         assert budget_high > budget_low
+
+    def test_rung_spend_goes_to_cheapest_option(self) -> None:
+        """Test each rung's minimum spend is placed on its cheapest option."""
+        options = [
+            PutOption(strike=3700, premium=40, expiry_years=0.25),  # shallow
+            PutOption(strike=3500, premium=25, expiry_years=0.25),  # shallow
+            PutOption(strike=3100, premium=10, expiry_years=0.25),  # medium
+            PutOption(strike=2300, premium=2, expiry_years=0.25),  # catastrophic
+        ]
+
+        quantities, total_cost, budget = solve_vix_ladder_lp(
+            options=options,
+            V0=1_000_000,
+            S0=4000,
+            beta=1.0,
+            sigma=0.2,
+            T_years=0.25,
+            vix=20.0,
+        )
+
+        assert quantities[0] == 0.0
+        assert quantities[1] == pytest.approx(budget * 0.05 / 25)
+        assert quantities[2] == pytest.approx(budget * 0.15 / 10)
+        assert quantities[3] == pytest.approx(budget * 0.50 / 2)
+        assert total_cost == pytest.approx(budget * (0.05 + 0.15 + 0.50))
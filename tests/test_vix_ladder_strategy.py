@@ -78,6 +78,47 @@ class TestVixLadderStrategy:
         assert "last_lp_hedge" in params
         assert cost > 0
 
+    def test_sigma_cached_across_calls(self) -> None:
+        """Test sigma is estimated once and reused on later hedge dates."""
+        portfolio = Portfolio(initial_value=1_000_000, beta=1.0)
+        portfolio.equity_value = 1_000_000
+        portfolio.cash = 50_000
+
+        market = SimpleMock(_get_vix=lambda date: 20.0)
+        params = {
+            "expiry_days": 90,
+            "strike_density": 0.10,
+        }
+
+        vix_ladder_strategy(portfolio, 4000.0, datetime(2020, 1, 1), params, market)
+        sigma = params["_sigma"]
+        expected = market.data["Close"].pct_change().std() * (252**0.5)
+        assert sigma == pytest.approx(expected)
+
+        # Changing the data afterwards must not trigger a recomputation
+        market.data["Close"] = [4000.0 * (1.0 + (-1) ** i * 0.02) for i in range(100)]
+        vix_ladder_strategy(portfolio, 4000.0, datetime(2020, 1, 2), params, market)
+        assert params["_sigma"] == sigma
+
+        # Reusing the params with another market re-estimates sigma
+        other = SimpleMock(_get_vix=lambda date: 20.0, data=market.data)
+        vix_ladder_strategy(portfolio, 4000.0, datetime(2020, 1, 3), params, other)
+        assert params["_sigma"] != sigma
+
+    def test_sigma_param_does_not_override_estimate(self) -> None:
+        """Test a user-supplied sigma key is ignored in favor of the estimate."""
+        portfolio = Portfolio(initial_value=1_000_000, beta=1.0)
+        portfolio.equity_value = 1_000_000
+        portfolio.cash = 50_000
+
+        market = SimpleMock(_get_vix=lambda date: 20.0)
+        params = {"expiry_days": 90, "strike_density": 0.10, "sigma": 5.0}
+
+        vix_ladder_strategy(portfolio, 4000.0, datetime(2020, 1, 1), params, market)
+        expected = market.data["Close"].pct_change().std() * (252**0.5)
+        assert params["_sigma"] == pytest.approx(expected)
+        assert params["sigma"] == 5.0
+
     def test_verbose_mode(self) -> None:
         """Test verbose mode prints debug info."""
         portfolio = Portfolio(initial_value=1_000_000, beta=1.0)
@@ -10,7 +10,9 @@ import pandas as pd
 import pytest
 from cryptography.fernet import Fernet, InvalidToken
 
+from options_hedge import wrds_data
 from options_hedge.wrds_data import (
+    clear_decrypted_cache,
     get_wrds_data_info,
     load_encrypted_spx_options_data,
     load_encrypted_wrds_data,
@@ -87,6 +89,15 @@ class TestLoadEncryptedWRDSData:
                 encrypted_path="/nonexistent/path.enc", key="fake-key"
             )
 
+    def test_load_missing_file_without_key(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a missing file is reported before a missing key."""
+        monkeypatch.delenv("WRDS_DATA_KEY", raising=False)
+
+        with pytest.raises(FileNotFoundError, match="Encrypted WRDS data not found"):
+            load_encrypted_wrds_data(encrypted_path="/nonexistent/path.enc")
+
     def test_load_missing_key(
         self, encrypted_test_file: tuple[Path, str], monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -105,6 +116,96 @@ class TestLoadEncryptedWRDSData:
         with pytest.raises(ValueError, match="Decryption failed"):
             load_encrypted_wrds_data(encrypted_path=str(enc_file), key=wrong_key)
 
+    def test_repeat_load_uses_cache(
+        self, encrypted_test_file: tuple[Path, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a second load of the same file skips decryption."""
+        enc_file, key = encrypted_test_file
+        first = load_encrypted_wrds_data(encrypted_path=str(enc_file), key=key)
+
+        def fail_decrypt(self: Fernet, token: bytes) -> bytes:
+            raise AssertionError("decrypt should not run on a cache hit")
+
+        monkeypatch.setattr(Fernet, "decrypt", fail_decrypt)
+        second = load_encrypted_wrds_data(encrypted_path=str(enc_file), key=key)
+        pd.testing.assert_frame_equal(first, second)
+
+        # Adding columns or editing values in a returned frame must not
+        # leak into the cache
+        second["extra"] = 1.0
+        second.loc[0, "strike_price"] = -1.0
+        third = load_encrypted_wrds_data(encrypted_path=str(enc_file), key=key)
+        assert "extra" not in third.columns
+        pd.testing.assert_frame_equal(first, third)
+
+    def test_cache_is_bounded(
+        self, encrypted_test_file: tuple[Path, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the oldest decoded frame is evicted once the cache is full."""
+        enc_file, key = encrypted_test_file
+        monkeypatch.setattr(wrds_data, "DECRYPTED_CACHE_SIZE", 2)
+        clear_decrypted_cache()
+
+        for columns in (("date",), ("date", "exdate"), ("date", "strike_price")):
+            load_encrypted_wrds_data(
+                encrypted_path=str(enc_file), key=key, columns=columns
+            )
+
+        assert len(wrds_data._DECRYPTED_CACHE) == 2
+
+    def test_cache_does_not_bypass_key_check(
+        self, encrypted_test_file: tuple[Path, str]
+    ) -> None:
+        """Test a cached file still rejects the wrong key."""
+        enc_file, key = encrypted_test_file
+        load_encrypted_wrds_data(encrypted_path=str(enc_file), key=key)
+
+        wrong_key = Fernet.generate_key().decode()
+        with pytest.raises(ValueError, match="Decryption failed"):
+            load_encrypted_wrds_data(encrypted_path=str(enc_file), key=wrong_key)
+
+    def test_pyarrow_engine_matches_c_engine(
+        self, encrypted_test_file: tuple[Path, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the pyarrow and C CSV engines produce the same frame."""
+        pytest.importorskip("pyarrow")
+        import options_hedge.wrds_data as wrds_module
+
+        enc_file, key = encrypted_test_file
+
+        monkeypatch.setattr(wrds_module, "PYARROW_AVAILABLE", False)
+        wrds_module.clear_decrypted_cache()
+        c_engine = load_encrypted_wrds_data(encrypted_path=str(enc_file), key=key)
+
+        monkeypatch.setattr(wrds_module, "PYARROW_AVAILABLE", True)
+        wrds_module.clear_decrypted_cache()
+        arrow_engine = load_encrypted_wrds_data(encrypted_path=str(enc_file), key=key)
+
+        pd.testing.assert_frame_equal(c_engine, arrow_engine)
+
+    def test_column_selection(
+        self, tmp_path: Path, sample_wrds_data: pd.DataFrame
+    ) -> None:
+        """Test undocumented columns are dropped unless requested."""
+        key = Fernet.generate_key()
+        wide = sample_wrds_data.assign(optionid=[1, 2, 3, 4])
+        enc_file = tmp_path / "wide.enc"
+        enc_file.write_bytes(
+            Fernet(key).encrypt(gzip.compress(wide.to_csv(index=False).encode()))
+        )
+
+        default = load_encrypted_wrds_data(str(enc_file), key.decode())
+        assert list(default.columns) == list(sample_wrds_data.columns)
+
+        everything = load_encrypted_wrds_data(str(enc_file), key.decode(), None)
+        assert "optionid" in everything.columns
+
+        subset = load_encrypted_wrds_data(
+            str(enc_file), key.decode(), columns=["date", "strike_price"]
+        )
+        assert list(subset.columns) == ["date", "strike_price"]
+        assert pd.api.types.is_datetime64_any_dtype(subset["date"])
+
     def test_load_from_env_var(
         self, encrypted_test_file: tuple[Path, str], monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -178,7 +279,10 @@ class TestLoadEncryptedWRDSData:
 
         # Check data types
         assert data["strike_price"].dtype == float
-        assert data["best_bid"].dtype == float
+        assert data["best_bid"].dtype == "float32"
+        assert pd.api.types.is_signed_integer_dtype(data["volume"])
+        # Signed, so day-over-day changes can go negative without wrapping
+        assert (data["open_interest"].diff().dropna() < 0).any()
 
         # Check date parsing
         assert data["date"].min() == pd.Timestamp("2020-01-02")
@@ -433,5 +537,7 @@ class TestLoadEncryptedSPXOptionsData:
         assert pd.api.types.is_numeric_dtype(data["best_bid"])
         assert pd.api.types.is_numeric_dtype(data["best_offer"])
 
-        # Check string types
-        assert data["cp_flag"].dtype == object
+        # Check compact types
+        assert isinstance(data["cp_flag"].dtype, pd.CategoricalDtype)
+        assert data["best_bid"].dtype == "float32"
+        assert data["strike_price"].dtype == "float64"